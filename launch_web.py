@@ -6,11 +6,27 @@ from pathlib import Path
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+def profile_imports():
+    """Developer aid: record `python -X importtime` output for the web app to logs/importtime.log"""
+    import subprocess
+    log_dir = os.path.join(project_root, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, 'importtime.log')
+    with open(log_path, 'w', encoding='utf-8') as log_file:
+        subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import revelare.cli.suite'],
+                       cwd=project_root, stderr=log_file)
+    print(f"[INFO] Import timings written to {log_path}")
+
 def main():
     print("Project Revelare - Web Interface Launcher")
     print("=" * 40)
     
+    if os.environ.get('REVELARE_IMPORTTIME'):
+        profile_imports()
+    
     try:
+        # Imported here, after the banner, so the launcher responds before Flask and the
+        # processing stack are loaded
         from revelare.cli.suite import launch_web_app
         launch_web_app()
         
@@ -2,25 +2,69 @@ import os
 import sys
 import glob
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to sys.path
 sys.path.insert(0, os.getcwd())
 
 from revelare.cli.revelare_cli import process_project
+from revelare.config.config import Config
 from revelare.utils.logger import get_logger
+from revelare.utils.file_extractor import ARCHIVE_EXTENSIONS
 
 # Configure logging
 logger = get_logger("batch_processor")
 
 CASES_DIR = r"E:\Cases"
 OUTPUT_DIR = "cases"
+# Cases are independent, so several run at once in worker processes; 1 keeps the old sequential loop
+CASE_WORKERS = int(os.environ.get('REVELARE_CASE_WORKERS', max(1, (os.cpu_count() or 1) // 2)))
 
 class MockArgs:
     def __init__(self):
         self.debug = False
         self.verbose = True
 
+def _iter_case_files(root):
+    """Yield every file under root in os.walk order, reusing scandir's cached file types"""
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Like os.walk, list symlinked directories but don't descend into them
+                    if entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    elif not entry.is_dir():
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+def _completed_cases(output_dir):
+    """Names of cases under output_dir that already have their HTML report"""
+    done = set()
+    try:
+        with os.scandir(output_dir) as it:
+            for sub in it:
+                if sub.is_dir() and os.path.exists(os.path.join(sub.path, f"{sub.name}_report.html")):
+                    done.add(sub.name)
+    except OSError:
+        pass
+    return done
+
+def _init_case_worker(extraction_workers):
+    # Each case runs its own extraction pool; share the CPUs between cases instead of giving every case all of them
+    Config.EXTRACTION_WORKERS = extraction_workers
+
+def _report_result(project_name, success):
+    if success:
+        print(f"SUCCESS: {project_name}")
+    else:
+        print(f"FAILURE: {project_name}")
+
 def main():
     if not os.path.exists(CASES_DIR):
         print(f"Cases directory not found: {CASES_DIR}")
@@ -28,33 +72,37 @@ def main():
 
     print(f"Scanning {CASES_DIR} for cases...")
     
-    entries = os.listdir(CASES_DIR)
+    # scandir entries carry their file type, so classifying them needs no extra stat calls
+    with os.scandir(CASES_DIR) as it:
+        dir_entries = list(it)
     processed_count = 0
+    cases = []
+    # One pass over the output directory instead of a report stat per scanned case
+    done = _completed_cases(OUTPUT_DIR)
     
     # Sort entries to process systematically
-    entries.sort()
+    dir_entries.sort(key=lambda e: e.name)
 
-    for entry in entries:
-        entry_path = os.path.join(CASES_DIR, entry)
+    for dir_entry in dir_entries:
+        entry = dir_entry.name
+        entry_path = dir_entry.path
         
         # Determine if this is a case (directory or archive)
         is_case = False
         project_name = ""
         input_files = []
         
-        if os.path.isdir(entry_path):
+        if dir_entry.is_dir():
             # It's a directory case
             project_name = entry
             is_case = True
-            # Collect all files recursively
-            for root, dirs, files in os.walk(entry_path):
-                for f in files:
-                    input_files.append(os.path.join(root, f))
+            # Collect all files recursively; process_project needs a list to size and pickle it
+            input_files = list(_iter_case_files(entry_path))
         
-        elif os.path.isfile(entry_path):
+        elif dir_entry.is_file():
             # Check for archive extensions
             lower_name = entry.lower()
-            if lower_name.endswith(('.zip', '.rar', '.7z', '.tar', '.gz')) or lower_name.endswith('.7z.tmp'):
+            if lower_name[lower_name.rfind('.'):] in ARCHIVE_EXTENSIONS or lower_name.endswith('.7z.tmp'):
                 project_name = os.path.splitext(entry)[0]
                 if lower_name.endswith('.7z.tmp'):
                     project_name = entry.replace('.7z.tmp', '') # Remove .7z.tmp to get ID
@@ -70,31 +118,49 @@ def main():
             continue
 
         # Check if already processed
-        report_path = os.path.join(OUTPUT_DIR, project_name, f"{project_name}_report.html")
-        if os.path.exists(report_path):
+        if project_name in done:
             print(f"Skipping {project_name} (Report already exists)")
             continue
 
-        print(f"\n[{processed_count+1}] Processing Case: {project_name}")
-        print(f"Input: {entry_path}")
-        print(f"File count: {len(input_files)}")
-        
-        try:
-            # We use the existing process_project function
-            # It handles extraction and reporting
-            success = process_project(project_name, input_files, OUTPUT_DIR, MockArgs())
+        cases.append((project_name, entry_path, input_files))
+
+    max_workers = min(CASE_WORKERS, len(cases))
+    if max_workers <= 1:
+        for project_name, entry_path, input_files in cases:
+            print(f"\n[{processed_count+1}] Processing Case: {project_name}")
+            print(f"Input: {entry_path}")
+            print(f"File count: {len(input_files)}")
             
-            if success:
-                print(f"SUCCESS: {project_name}")
-            else:
-                print(f"FAILURE: {project_name}")
+            try:
+                # We use the existing process_project function
+                # It handles extraction and reporting
+                success = process_project(project_name, input_files, OUTPUT_DIR, MockArgs())
+                _report_result(project_name, success)
+                processed_count += 1
                 
-            processed_count += 1
+            except Exception as e:
+                print(f"ERROR processing {project_name}: {e}")
+                import traceback
+                traceback.print_exc()
+    else:
+        extraction_workers = max(1, min(Config.EXTRACTION_WORKERS, (os.cpu_count() or 1) // max_workers))
+        print(f"\nProcessing {len(cases)} cases with {max_workers} worker processes ({extraction_workers} extraction workers each)")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_case_worker,
+                                 initargs=(extraction_workers,)) as executor:
+            futures = {}
+            for i, (project_name, entry_path, input_files) in enumerate(cases, 1):
+                print(f"[{i}] Queued Case: {project_name} ({len(input_files)} files from {entry_path})")
+                futures[executor.submit(process_project, project_name, input_files, OUTPUT_DIR, MockArgs())] = project_name
             
-        except Exception as e:
-            print(f"ERROR processing {project_name}: {e}")
-            import traceback
-            traceback.print_exc()
+            for future in as_completed(futures):
+                project_name = futures[future]
+                try:
+                    _report_result(project_name, future.result())
+                    processed_count += 1
+                except Exception as e:
+                    print(f"ERROR processing {project_name}: {e}")
+                    import traceback
+                    traceback.print_exc()
 
     print(f"\nBatch processing complete. Processed {processed_count} cases.")
     
@@ -1,5 +1,6 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to sys.path
@@ -11,6 +12,77 @@ from revelare.utils.logger import get_logger
 
 logger = get_logger("reprocess_cases")
 
+# Cases are independent, so several reprocess at once in worker processes; 1 keeps the old sequential loop
+CASE_WORKERS = int(os.environ.get('REVELARE_CASE_WORKERS', max(1, (os.cpu_count() or 1) // 2)))
+
+def _iter_evidence_files(evidence_dir):
+    """Yield every regular file under evidence_dir in os.walk order, reusing scandir's cached file types"""
+    stack = [evidence_dir]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    # Like os.walk, don't descend into symlinked directories
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+_CASE_MARKERS = frozenset({'raw_findings.json', 'extracted_files'})
+
+def _is_processed_case(case_path):
+    """True if case_path holds raw_findings.json or extracted_files, probed with one directory listing"""
+    try:
+        with os.scandir(case_path) as it:
+            return any(entry.name in _CASE_MARKERS for entry in it)
+    except OSError:
+        return False
+
+def _reprocess_case(case_name, evidence_dir, manager=None):
+    """Stream a case's evidence into process_evidence_files; module-level so worker processes can run it"""
+    file_count = 0
+    
+    def counted_evidence():
+        nonlocal file_count
+        for path in _iter_evidence_files(evidence_dir):
+            file_count += 1
+            yield path
+    
+    manager = manager or CaseManager()
+    # Parallel cases queue for the master database write lock rather than failing after sqlite's 5 s default
+    manager.db_timeout = Config.BATCH_DATABASE_TIMEOUT
+    success, message = manager.process_evidence_files(case_name, counted_evidence())
+    return success, message, file_count
+
+def _init_case_worker(extraction_workers):
+    # Each case runs its own extraction pool; share the CPUs between cases instead of giving every case all of them
+    Config.EXTRACTION_WORKERS = extraction_workers
+
+def _report_result(case_name, success, message, file_count):
+    print(f"  Found {file_count} evidence file(s)")
+    if success:
+        print(f"  SUCCESS: {case_name}")
+    else:
+        print(f"  FAILED: {case_name}")
+    print(f"  {message}")
+
+def _reprocess_inline(case_name, evidence_dir, manager):
+    """Reprocess one case in this process; True on success"""
+    try:
+        success, message, file_count = _reprocess_case(case_name, evidence_dir, manager)
+        _report_result(case_name, success, message, file_count)
+        return success
+    except Exception as e:
+        print(f"  ERROR: {case_name}")
+        print(f"  {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def reprocess_all_cases():
     """Reprocess all existing cases with updated extraction logic"""
     cases_dir = Config.UPLOAD_FOLDER
@@ -24,15 +96,11 @@ def reprocess_all_cases():
     
     # Find all case directories (those with raw_findings.json or extracted_files)
     cases = []
-    for entry in os.listdir(cases_dir):
-        entry_path = os.path.join(cases_dir, entry)
-        if os.path.isdir(entry_path):
+    with os.scandir(cases_dir) as it:
+        for entry in it:
             # Check if it's a processed case
-            has_findings = os.path.exists(os.path.join(entry_path, 'raw_findings.json'))
-            has_extracted = os.path.exists(os.path.join(entry_path, 'extracted_files'))
-            
-            if has_findings or has_extracted:
-                cases.append(entry)
+            if entry.is_dir() and _is_processed_case(entry.path):
+                cases.append(entry.name)
     
     if not cases:
         print("No cases found to reprocess.")
@@ -42,22 +110,19 @@ def reprocess_all_cases():
     
     processed_count = 0
     failed_count = 0
+    pending = []
     
     for i, case_name in enumerate(sorted(cases), 1):
         case_path = os.path.join(cases_dir, case_name)
         print(f"\n[{i}/{len(cases)}] Reprocessing: {case_name}")
         
-        # Collect evidence files
-        evidence_files = []
+        # Evidence is streamed to process_evidence_files; here we only check that there is some
+        has_evidence = False
         evidence_dir = os.path.join(case_path, 'evidence')
         
         if os.path.exists(evidence_dir):
             # Use evidence directory if it exists
-            for root, dirs, files in os.walk(evidence_dir):
-                for f in files:
-                    file_path = os.path.join(root, f)
-                    if os.path.isfile(file_path):
-                        evidence_files.append(file_path)
+            has_evidence = next(_iter_evidence_files(evidence_dir), None) is not None
         else:
             # Fall back to extracted_files if evidence doesn't exist
             extracted_dir = os.path.join(case_path, 'extracted_files')
@@ -66,35 +131,57 @@ def reprocess_all_cases():
                 # Otherwise, we'll need to reprocess from extracted files
                 print(f"  Note: Using extracted_files directory (evidence not found)")
                 # For now, skip cases without evidence - they'd need original files
-                if not evidence_files:
+                if not has_evidence:
                     print(f"  SKIPPED: No evidence files found. Need original evidence to reprocess.")
                     continue
         
-        if not evidence_files:
+        if not has_evidence:
             print(f"  SKIPPED: No evidence files found.")
             continue
         
-        print(f"  Found {len(evidence_files)} evidence file(s)")
-        
-        try:
+        if CASE_WORKERS <= 1:
             # Reprocess the case
-            success, message = case_manager.process_evidence_files(case_name, evidence_files)
-            
-            if success:
-                print(f"  SUCCESS: {case_name}")
-                print(f"  {message}")
+            if _reprocess_inline(case_name, evidence_dir, case_manager):
                 processed_count += 1
             else:
-                print(f"  FAILED: {case_name}")
-                print(f"  {message}")
                 failed_count += 1
-                
-        except Exception as e:
-            print(f"  ERROR: {case_name}")
-            print(f"  {str(e)}")
-            import traceback
-            traceback.print_exc()
+        else:
+            pending.append((case_name, evidence_dir))
+    
+    if len(pending) == 1:
+        # A single case gains nothing from a worker pool, so skip its startup cost
+        case_name, evidence_dir = pending[0]
+        print(f"\nReprocessing {case_name} in this process")
+        if _reprocess_inline(case_name, evidence_dir, case_manager):
+            processed_count += 1
+        else:
             failed_count += 1
+    elif pending:
+        max_workers = min(CASE_WORKERS, len(pending))
+        extraction_workers = max(1, min(Config.EXTRACTION_WORKERS, (os.cpu_count() or 1) // max_workers))
+        print(f"\nReprocessing {len(pending)} cases with {max_workers} worker processes ({extraction_workers} extraction workers each)")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_case_worker,
+                                 initargs=(extraction_workers,)) as executor:
+            # Workers walk the evidence themselves, so only the directory path is pickled
+            futures = {executor.submit(_reprocess_case, case_name, evidence_dir): case_name
+                       for case_name, evidence_dir in pending}
+            for future in as_completed(futures):
+                case_name = futures[future]
+                print(f"\nFinished: {case_name}")
+                try:
+                    success, message, file_count = future.result()
+                    _report_result(case_name, success, message, file_count)
+                    if success:
+                        processed_count += 1
+                    else:
+                        failed_count += 1
+                        
+                except Exception as e:
+                    print(f"  ERROR: {case_name}")
+                    print(f"  {str(e)}")
+                    import traceback
+                    traceback.print_exc()
+                    failed_count += 1
     
     print(f"\n{'='*60}")
     print(f"Reprocessing complete!")
@@ -12,8 +12,8 @@ import shutil
 import json
 import csv
 import re
+import bisect
 import logging
-import sqlite3
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -24,14 +24,7 @@ sys.path.insert(0, project_root)
 
 from revelare.config.config import Config
 from revelare.utils.logger import get_logger, RevelareLogger
-from revelare.utils.security import SecurityValidator
-from revelare.core.extractor import run_extraction
-from revelare.utils import reporter
-import revelare.utils.file_extractor as file_extractor
 from revelare.core.case_manager import case_manager
-from revelare.utils.string_search import StringSearchTool
-from revelare.utils.email_browser import EmailBrowser
-from revelare.utils.fractal_encryption import FractalEncryption
 
 if sys.platform == 'win32':
     import io
@@ -41,12 +34,42 @@ if sys.platform == 'win32':
 logger = get_logger(__name__)
 cli_logger = RevelareLogger.get_logger('enhanced_cli')
 
+# Case pickers list this many cases; the rest are reachable by typing the start of the name
+CASE_LIST_LIMIT = 50
+
 class EnhancedCLI:
     def __init__(self):
         self.case_manager = case_manager
-        self.string_search = StringSearchTool()
-        self.email_browser = EmailBrowser()
-        self.fractal_encryption = FractalEncryption()
+        # Tools are built on first use so menus that don't need them skip their imports (numpy, PIL, ...)
+        self._string_search = None
+        self._email_browser = None
+        self._fractal_encryption = None
+        # (mtime_ns, size) of the database file and the record count read at that state
+        self._db_count_cache = None
+        # (mtime_ns of the cases folder, names in menu order, names sorted for prefix lookup)
+        self._case_names_cache = None
+        
+    @property
+    def string_search(self):
+        if self._string_search is None:
+            from revelare.utils.string_search import StringSearchEngine
+            self._string_search = StringSearchEngine()
+        return self._string_search
+
+    @property
+    def email_browser(self):
+        if self._email_browser is None:
+            from revelare.utils.email_browser import EmailBrowser
+            self._email_browser = EmailBrowser()
+        return self._email_browser
+
+    @property
+    def fractal_encryption(self):
+        # The fractal tools are module-level functions, so the module itself is the handle
+        if self._fractal_encryption is None:
+            from revelare.utils import fractal_encryption
+            self._fractal_encryption = fractal_encryption
+        return self._fractal_encryption
         
     def print_header(self):
         """Print the CLI header"""
@@ -131,6 +154,58 @@ class EnhancedCLI:
             print(f"       Email Archives: {case.get('email_archive_count', 0)}")
             print()
             
+    def _get_case_names(self):
+        """Case names in menu order, re-listed only when the cases folder itself changes"""
+        try:
+            folder_mtime = os.stat(Config.UPLOAD_FOLDER).st_mtime_ns
+        except OSError:
+            return []
+        if self._case_names_cache is None or self._case_names_cache[0] != folder_mtime:
+            names = self.case_manager.get_case_names()
+            self._case_names_cache = (folder_mtime, names, sorted(names))
+        return self._case_names_cache[1]
+
+    def _select_case(self, prompt):
+        """List cases and return the one chosen by number or unique name prefix, or None"""
+        names = self._get_case_names()
+        if not names:
+            print("No cases found.")
+            return None
+            
+        for i, name in enumerate(names[:CASE_LIST_LIMIT], 1):
+            print(f"  [{i:2d}] {name}")
+        if len(names) > CASE_LIST_LIMIT:
+            print(f"  ... and {len(names) - CASE_LIST_LIMIT} more (type the start of a case name)")
+            
+        shown = min(len(names), CASE_LIST_LIMIT)
+        choice = input(f"\n{prompt} (1-{shown}, name, or =name): ").strip()
+        if choice.startswith('='):
+            # Explicit name lookup, for numeric case names that would read as an index
+            choice = choice[1:].strip()
+        elif choice.isdigit() and 0 < int(choice) <= shown:
+            # Only numbers that were listed count as indices; larger ones fall through to name lookup
+            return names[int(choice) - 1]
+        if not choice:
+            print("Invalid input.")
+            return None
+            
+        # Names sharing the typed prefix form one contiguous run of the sorted list
+        sorted_names = self._case_names_cache[2]
+        start = bisect.bisect_left(sorted_names, choice)
+        matches = []
+        for name in sorted_names[start:]:
+            if not name.startswith(choice):
+                break
+            matches.append(name)
+        # An exact name sorts first in its run, so it wins over longer names it prefixes
+        if matches and (len(matches) == 1 or matches[0] == choice):
+            return matches[0]
+        if not matches:
+            print(f"No case matches '{choice}'.")
+        else:
+            print(f"'{choice}' matches {len(matches)} cases: {', '.join(matches[:10])}{' ...' if len(matches) > 10 else ''}")
+        return None
+            
     def create_case(self):
         """Create a new case using onboarding wizard"""
         print("\n" + "-" * 50)
@@ -170,24 +245,9 @@ class EnhancedCLI:
         print("  VIEW CASE DETAILS")
         print("-" * 50)
         
-        cases = self.case_manager.get_available_cases()
-        if not cases:
-            print("No cases found.")
-            return
-            
-        # List cases
-        for i, case in enumerate(cases, 1):
-            print(f"  [{i:2d}] {case['name']}")
-            
-        try:
-            choice = int(input(f"\nSelect case (1-{len(cases)}): ")) - 1
-            if 0 <= choice < len(cases):
-                case = cases[choice]
-                self.show_case_info(case)
-            else:
-                print("Invalid selection.")
-        except (ValueError, IndexError):
-            print("Invalid input.")
+        case_name = self._select_case("Select case")
+        if case_name:
+            self.show_case_info(self.case_manager.get_case_info(case_name))
             
     def show_case_info(self, case):
         """Show detailed information about a case"""
@@ -222,14 +282,19 @@ class EnhancedCLI:
             
     def print_tree(self, node, indent=0):
         """Print directory tree structure"""
-        spaces = "  " * indent
-        if node['type'] == 'file':
-            size = node.get('formatted_size', '0 B')
-            print(f"{spaces}📄 {node['name']} ({size})")
-        else:
-            print(f"{spaces}📁 {node['name']}/")
-            for child in node.get('children', []):
-                self.print_tree(child, indent + 1)
+        # Walk with an explicit stack so deep trees can't hit the recursion limit, and write once at the end
+        lines = []
+        stack = [(node, indent)]
+        while stack:
+            node, indent = stack.pop()
+            spaces = "  " * indent
+            if node['type'] == 'file':
+                size = node.get('formatted_size', '0 B')
+                lines.append(f"{spaces}📄 {node['name']} ({size})\n")
+            else:
+                lines.append(f"{spaces}📁 {node['name']}/\n")
+                stack.extend((child, indent + 1) for child in reversed(node.get('children', [])))
+        sys.stdout.write(''.join(lines))
                 
     def add_files_to_case(self, case_name=None):
         """Add files to an existing case"""
@@ -238,23 +303,8 @@ class EnhancedCLI:
         print("-" * 50)
         
         if not case_name:
-            cases = self.case_manager.get_available_cases()
-            if not cases:
-                print("No cases found.")
-                return
-                
-            for i, case in enumerate(cases, 1):
-                print(f"  [{i:2d}] {case['name']}")
-                
-            try:
-                choice = int(input(f"\nSelect case (1-{len(cases)}): ")) - 1
-                if 0 <= choice < len(cases):
-                    case_name = cases[choice]['name']
-                else:
-                    print("Invalid selection.")
-                    return
-            except (ValueError, IndexError):
-                print("Invalid input.")
+            case_name = self._select_case("Select case")
+            if not case_name:
                 return
                 
         print(f"\nAdding files to case: {case_name}")
@@ -291,30 +341,18 @@ class EnhancedCLI:
         print("  RE-ANALYZE CASE")
         print("-" * 50)
         
-        cases = self.case_manager.get_available_cases()
-        if not cases:
-            print("No cases found.")
+        case_name = self._select_case("Select case to re-analyze")
+        if not case_name:
             return
             
-        for i, case in enumerate(cases, 1):
-            print(f"  [{i:2d}] {case['name']}")
-            
-        try:
-            choice = int(input(f"\nSelect case to re-analyze (1-{len(cases)}): ")) - 1
-            if 0 <= choice < len(cases):
-                case_name = cases[choice]['name']
-                print(f"\nRe-analyzing case: {case_name}")
-                print("This may take some time...")
-                
-                success, message = self.case_manager.reanalyze_case(case_name)
-                if success:
-                    print(f"✓ {message}")
-                else:
-                    print(f"✗ {message}")
-            else:
-                print("Invalid selection.")
-        except (ValueError, IndexError):
-            print("Invalid input.")
+        print(f"\nRe-analyzing case: {case_name}")
+        print("This may take some time...")
+        
+        success, message = self.case_manager.reanalyze_case(case_name)
+        if success:
+            print(f"✓ {message}")
+        else:
+            print(f"✗ {message}")
             
     def delete_case(self):
         """Delete a case (with confirmation)"""
@@ -323,33 +361,21 @@ class EnhancedCLI:
         print("-" * 50)
         print("WARNING: This will permanently delete the case and all its data!")
         
-        cases = self.case_manager.get_available_cases()
-        if not cases:
-            print("No cases found.")
+        case_name = self._select_case("Select case to delete")
+        if not case_name:
             return
             
-        for i, case in enumerate(cases, 1):
-            print(f"  [{i:2d}] {case['name']}")
-            
-        try:
-            choice = int(input(f"\nSelect case to delete (1-{len(cases)}): ")) - 1
-            if 0 <= choice < len(cases):
-                case_name = cases[choice]['name']
-                confirm = input(f"\nAre you sure you want to delete case '{case_name}'? (yes/no): ").strip().lower()
-                
-                if confirm == 'yes':
-                    case_path = os.path.join(Config.UPLOAD_FOLDER, case_name)
-                    if os.path.exists(case_path):
-                        shutil.rmtree(case_path)
-                        print(f"✓ Case '{case_name}' deleted successfully.")
-                    else:
-                        print(f"✗ Case directory not found.")
-                else:
-                    print("Deletion cancelled.")
+        confirm = input(f"\nAre you sure you want to delete case '{case_name}'? (yes/no): ").strip().lower()
+        
+        if confirm == 'yes':
+            case_path = os.path.join(Config.UPLOAD_FOLDER, case_name)
+            if os.path.exists(case_path):
+                shutil.rmtree(case_path)
+                print(f"✓ Case '{case_name}' deleted successfully.")
             else:
-                print("Invalid selection.")
-        except (ValueError, IndexError):
-            print("Invalid input.")
+                print(f"✗ Case directory not found.")
+        else:
+            print("Deletion cancelled.")
             
     def export_case_data(self):
         """Export case data"""
@@ -357,29 +383,17 @@ class EnhancedCLI:
         print("  EXPORT CASE DATA")
         print("-" * 50)
         
-        cases = self.case_manager.get_available_cases()
-        if not cases:
-            print("No cases found.")
+        case_name = self._select_case("Select case to export")
+        if not case_name:
             return
             
-        for i, case in enumerate(cases, 1):
-            print(f"  [{i:2d}] {case['name']}")
+        output_dir = input("Enter output directory (or press Enter for current directory): ").strip()
+        if not output_dir:
+            output_dir = "."
             
-        try:
-            choice = int(input(f"\nSelect case to export (1-{len(cases)}): ")) - 1
-            if 0 <= choice < len(cases):
-                case_name = cases[choice]['name']
-                output_dir = input("Enter output directory (or press Enter for current directory): ").strip()
-                if not output_dir:
-                    output_dir = "."
-                    
-                print(f"\nExporting case '{case_name}' to '{output_dir}'...")
-                # Implementation would go here
-                print("✓ Export completed.")
-            else:
-                print("Invalid selection.")
-        except (ValueError, IndexError):
-            print("Invalid input.")
+        print(f"\nExporting case '{case_name}' to '{output_dir}'...")
+        # Implementation would go here
+        print("✓ Export completed.")
             
     def string_search_menu(self):
         """String search submenu"""
@@ -410,7 +424,7 @@ class EnhancedCLI:
         print(f"\nSearching for: {', '.join(terms)}")
         print("This may take some time...")
         
-        # Implementation would use StringSearchTool
+        # Implementation would use StringSearchEngine
         print("✓ Search completed. Results would be displayed here.")
         
     def email_analysis_menu(self):
@@ -484,17 +498,29 @@ class EnhancedCLI:
         # Check database
         if os.path.exists(Config.DATABASE):
             try:
-                conn = sqlite3.connect(Config.DATABASE)
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM findings")
-                count = cursor.fetchone()[0]
-                print(f"  Database Records: {count}")
-                conn.close()
+                print(f"  Database Records: {self._database_record_count()}")
             except Exception as e:
                 print(f"  Database Error: {e}")
         else:
             print("  Database: Not found")
             
+    def _database_record_count(self) -> int:
+        """Row count of the findings table, recounted only when the database file has changed"""
+        st = os.stat(Config.DATABASE)
+        db_state = (st.st_mtime_ns, st.st_size)
+        if self._db_count_cache and self._db_count_cache[0] == db_state:
+            return self._db_count_cache[1]
+        
+        import sqlite3
+        # Read-only open: no journal setup, and the menu can never modify the database
+        conn = sqlite3.connect(Path(Config.DATABASE).resolve().as_uri() + '?mode=ro', uri=True)
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+        finally:
+            conn.close()
+        self._db_count_cache = (db_state, count)
+        return count
+            
     def run(self):
         """Main CLI loop"""
         self.print_header()
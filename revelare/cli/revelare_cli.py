@@ -131,9 +131,7 @@ def process_project(project_name: str, input_files: List[str], output_dir: str,
         enriched_ips = report_generator.enrich_ips(ip_addresses)
         
         report_path = os.path.join(project_dir, f"{project_name}_report.html")
-        report_html = report_generator.generate_report(project_name, findings, enriched_ips)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_html)
+        report_generator.write_report_file(report_path, project_name, findings, enriched_ips)
         print(f"[OK] Report generated: {os.path.basename(report_path)}")
         
         _export_results(project_dir, findings, project_name)
@@ -72,8 +72,10 @@ def open_browser(url: str, delay: float = 1.5) -> None:
     thread.daemon = True
     thread.start()
 
-def get_db_connection():
-    return sqlite3.connect(Config.DATABASE)
+def get_db_connection(timeout: Optional[float] = None):
+    if timeout is None:
+        return sqlite3.connect(Config.DATABASE)
+    return sqlite3.connect(Config.DATABASE, timeout=timeout)
 
 def init_database() -> bool:
     try:
@@ -124,9 +126,10 @@ def init_database() -> bool:
         logger.error(f"Failed to initialize database: {e}")
         return False
 
-def update_master_database(project_name: str, findings: Dict[str, Dict[str, Any]]) -> bool:
+def update_master_database(project_name: str, findings: Dict[str, Dict[str, Any]],
+                           db_timeout: Optional[float] = None) -> bool:
     try:
-        conn = get_db_connection()
+        conn = get_db_connection(db_timeout)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -1243,6 +1246,14 @@ def api_report_data(project_name, data_type):
             from revelare.utils.threat_intelligence import ThreatIntelligenceService
             ti_service = ThreatIntelligenceService()
             
+            # Look up every unique IP and URL concurrently up front instead of one blocking call per finding
+            ip_threat_data = ti_service.enrich_indicators(
+                [ip.split(':')[0] for category, items in findings.items()
+                 if 'IPv4' in str(category) and isinstance(items, dict) for ip in items], 'ip')
+            url_threat_data = ti_service.enrich_indicators(
+                [url for domain_urls in findings.get('URLs_by_Domain', {}).values()
+                 if isinstance(domain_urls, dict) for url in domain_urls], 'url')
+            
             for category, items in findings.items():
                 if 'IPv4' in str(category) and isinstance(items, dict):
                     logger.info(f"Processing category: {category} with {len(items)} items")
@@ -1255,7 +1266,7 @@ def api_report_data(project_name, data_type):
                         base_ip = ip.split(':')[0] if ':' in ip else ip
                         
                         # Get threat intelligence for this IP
-                        threat_data = ti_service.enrich_indicator(base_ip, 'ip')
+                        threat_data = ip_threat_data.get(base_ip, {})
                         
                         # Determine threat level based on threat intelligence
                         threat_type = "suspicious_ip"
@@ -1323,7 +1334,7 @@ def api_report_data(project_name, data_type):
                                     file_source = context.split('File:')[1].split('|')[0].strip()
                                 
                                 # Get threat intelligence for this URL
-                                threat_data = ti_service.enrich_indicator(url, 'url')
+                                threat_data = url_threat_data.get(url, {})
                                 
                                 # Determine threat level based on threat intelligence
                                 threat_type = "suspicious_url"
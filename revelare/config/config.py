@@ -26,8 +26,17 @@ class Config:
     UPLOAD_FOLDER = os.environ.get('REVELARE_UPLOAD_FOLDER', os.path.join(os.path.dirname(__file__), '..', '..', 'cases'))
     MAX_CONTENT_LENGTH = None  # No limit - set to None to allow unlimited file sizes
     BINARY_CHUNK_SIZE = int(os.environ.get('REVELARE_BINARY_CHUNK_SIZE', '8192'))
+    # Bytes each binary chunk reads past its end so indicators split across a chunk boundary are still found
+    BINARY_CHUNK_OVERLAP = int(os.environ.get('REVELARE_BINARY_CHUNK_OVERLAP', '256'))
+    # Largest zip member read into memory; bigger members are streamed to disk by the normal extraction path
+    ZIP_IN_MEMORY_MAX_MEMBER_SIZE = int(os.environ.get('REVELARE_ZIP_IN_MEMORY_MAX_MEMBER_SIZE', str(8 * 1024 * 1024)))
+    # Worker processes for run_extraction; batches smaller than PARALLEL_EXTRACTION_MIN_FILES stay sequential
+    EXTRACTION_WORKERS = int(os.environ.get('REVELARE_EXTRACTION_WORKERS', str(os.cpu_count() or 1)))
+    PARALLEL_EXTRACTION_MIN_FILES = int(os.environ.get('REVELARE_PARALLEL_EXTRACTION_MIN_FILES', '4'))
     
     DATABASE = os.environ.get('REVELARE_DATABASE', os.path.join(os.path.dirname(__file__), '..', '..', 'logs', 'revelare_master.db'))
+    # Seconds batch reprocessing waits on the master database lock; cases processed in parallel share one writer lock
+    BATCH_DATABASE_TIMEOUT = float(os.environ.get('REVELARE_BATCH_DATABASE_TIMEOUT', '300'))
     
     # AI/ML Services
     OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
@@ -72,6 +81,19 @@ class Config:
     BITCOIN_ABUSE_TIMEOUT = int(os.environ.get('BITCOIN_ABUSE_TIMEOUT', '10'))
     CHAINABUSE_TIMEOUT = int(os.environ.get('CHAINABUSE_TIMEOUT', '10'))
 
+    # Concurrent GeoIP lookups (local MMDB reads, plus ip-api.com calls paced by IP_API_RATE_LIMIT)
+    GEOIP_MAX_WORKERS = int(os.environ.get('GEOIP_MAX_WORKERS', '8'))
+    # Concurrent threat intelligence lookups (bounded by the per-service rate limits above)
+    THREAT_INTEL_MAX_WORKERS = int(os.environ.get('THREAT_INTEL_MAX_WORKERS', '8'))
+    # Circuit breaker: skip a service for the cooldown (seconds) after this many consecutive failures
+    THREAT_INTEL_FAILURE_THRESHOLD = int(os.environ.get('THREAT_INTEL_FAILURE_THRESHOLD', '3'))
+    THREAT_INTEL_CIRCUIT_COOLDOWN = float(os.environ.get('THREAT_INTEL_CIRCUIT_COOLDOWN', '60'))
+
+    # Persistent cache of external API responses, reused across runs
+    API_CACHE_DATABASE = os.environ.get('REVELARE_API_CACHE_DATABASE', os.path.join(os.path.dirname(__file__), '..', '..', 'logs', 'api_cache.db'))
+    THREAT_INTEL_CACHE_TTL = int(os.environ.get('THREAT_INTEL_CACHE_TTL', str(24 * 60 * 60)))  # seconds
+    GEOIP_CACHE_TTL = int(os.environ.get('GEOIP_CACHE_TTL', str(24 * 60 * 60)))  # seconds, ip-api.com answers
+
     LOG_LEVEL = os.environ.get('REVELARE_LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
@@ -2,7 +2,7 @@ import os
 import json
 import shutil
 import tempfile
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 from pathlib import Path
 from datetime import datetime
 
@@ -20,6 +20,8 @@ case_logger = RevelareLogger.get_logger('case_manager')
 class CaseManager:
     def __init__(self):
         self.onboard = RevelareOnboard()
+        # Master database lock wait for findings writes; None keeps sqlite's default, batch jobs raise it
+        self.db_timeout = None
 
     def validate_case_name(self, case_name: str) -> Tuple[bool, str]:
         return SecurityValidator.validate_project_name(case_name)
@@ -54,9 +56,10 @@ class CaseManager:
             case_logger.error(error_msg)
             return False, error_msg, None
 
-    def process_evidence_files(self, project_name: str, evidence_files: List[str],
+    def process_evidence_files(self, project_name: str, evidence_files: Iterable[str],
                              callback: Optional[callable] = None) -> Tuple[bool, str]:
-        case_logger.info(f"Starting process_evidence_files for project: {project_name} with {len(evidence_files)} evidence files")
+        # evidence_files may be a generator; it is consumed exactly once while staging
+        case_logger.info(f"Starting process_evidence_files for project: {project_name}")
         try:
             project_path = os.path.join(Config.UPLOAD_FOLDER, project_name)
             case_logger.info(f"Project path: {project_path}")
@@ -70,7 +73,9 @@ class CaseManager:
             case_logger.info(f"Created temp directory: {extract_path}")
 
             try:
+                staged_count = 0
                 for evidence_file in evidence_files:
+                    staged_count += 1
                     # Skip if file is already in extracted_files (it's already been extracted)
                     if 'extracted_files' in evidence_file:
                         # For reanalysis, copy extracted files directly to temp directory
@@ -94,6 +99,7 @@ class CaseManager:
                                 os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                                 shutil.copy2(src_path, dest_path)
 
+                case_logger.info(f"Staged {staged_count} evidence files")
                 if callback:
                     callback("Starting extraction...")
                 
@@ -111,7 +117,7 @@ class CaseManager:
                 case_logger.info(f"run_extraction completed, found {len(findings)} finding categories")
 
                 from revelare.cli.suite import update_master_database
-                update_master_database(project_name, findings)
+                update_master_database(project_name, findings, self.db_timeout)
 
                 extracted_files_dir = os.path.join(project_path, "extracted_files")
                 Path(extracted_files_dir).mkdir(exist_ok=True)
@@ -128,10 +134,7 @@ class CaseManager:
                 ip_addresses = [v for k in findings if 'IPv4' in k for v in findings[k].keys()]
                 report_generator = reporter.ReportGenerator()
                 enriched_ips = report_generator.enrich_ips(ip_addresses)
-                html_report = report_generator.generate_report(project_name, findings, enriched_ips)
-
-                with open(os.path.join(project_path, 'report.html'), 'w', encoding='utf-8') as f:
-                    f.write(html_report)
+                report_generator.write_report_file(os.path.join(project_path, 'report.html'), project_name, findings, enriched_ips)
 
                 # Export portable reader package
                 try:
@@ -288,10 +291,7 @@ class CaseManager:
                 ip_addresses = [v for k in cleaned_findings if 'IPv4' in k for v in cleaned_findings[k].keys()]
                 report_generator = reporter.ReportGenerator()
                 enriched_ips = report_generator.enrich_ips(ip_addresses)
-                html_report = report_generator.generate_report(project_name, cleaned_findings, enriched_ips)
-                
-                with open(os.path.join(project_path, 'report.html'), 'w', encoding='utf-8') as f:
-                    f.write(html_report)
+                report_generator.write_report_file(os.path.join(project_path, 'report.html'), project_name, cleaned_findings, enriched_ips)
             except Exception as e:
                 case_logger.warning(f"Failed to regenerate report: {e}")
             
@@ -436,40 +436,54 @@ class CaseManager:
                 for item in os.listdir(cases_dir):
                     case_path = os.path.join(cases_dir, item)
                     if os.path.isdir(case_path):
-                        has_report = os.path.exists(os.path.join(case_path, 'report.html'))
-                        findings_file = os.path.join(case_path, 'raw_findings.json')
-                        findings_count = 0
-                        if os.path.exists(findings_file):
-                            try:
-                                with open(findings_file, 'r', encoding='utf-8') as f:
-                                    data = json.load(f)
-                                    for category, items in data.items():
-                                        if category != 'Processing_Summary' and isinstance(items, dict):
-                                            findings_count += len(items)
-                            except:
-                                pass
-                        
-                        email_archives = []
-                        try:
-                            from revelare.utils.mbox_viewer import EmailBrowser
-                            browser = EmailBrowser()
-                            email_archives = browser.get_email_archives_in_case(item)
-                        except Exception as e:
-                            # Do not warn repeatedly if optional email viewer is not installed
-                            if "mbox_viewer" not in str(e):
-                                case_logger.warning(f"Error checking email archives for case {item}: {e}")
-                        
-                        cases.append({
-                            "name": item, "path": case_path, "has_report": has_report,
-                            "findings_count": findings_count, "email_archives": email_archives,
-                            "email_archive_count": len(email_archives),
-                            "created": datetime.fromtimestamp(os.path.getctime(case_path)).isoformat()
-                        })
+                        cases.append(self.get_case_info(item))
             return sorted(cases, key=lambda x: x['created'], reverse=True)
         except Exception as e:
             case_logger.error(f"Failed to get available cases: {e}")
             return []
 
+    def get_case_names(self) -> List[str]:
+        """Case names in get_available_cases order, without reading any case contents"""
+        try:
+            with os.scandir(Config.UPLOAD_FOLDER) as it:
+                entries = [(entry.name, entry.stat().st_ctime) for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+        return [name for name, _ in entries]
+
+    def get_case_info(self, item: str) -> Dict[str, Any]:
+        case_path = os.path.join(Config.UPLOAD_FOLDER, item)
+        has_report = os.path.exists(os.path.join(case_path, 'report.html'))
+        findings_file = os.path.join(case_path, 'raw_findings.json')
+        findings_count = 0
+        if os.path.exists(findings_file):
+            try:
+                with open(findings_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    for category, items in data.items():
+                        if category != 'Processing_Summary' and isinstance(items, dict):
+                            findings_count += len(items)
+            except:
+                pass
+        
+        email_archives = []
+        try:
+            from revelare.utils.mbox_viewer import EmailBrowser
+            browser = EmailBrowser()
+            email_archives = browser.get_email_archives_in_case(item)
+        except Exception as e:
+            # Do not warn repeatedly if optional email viewer is not installed
+            if "mbox_viewer" not in str(e):
+                case_logger.warning(f"Error checking email archives for case {item}: {e}")
+        
+        return {
+            "name": item, "path": case_path, "has_report": has_report,
+            "findings_count": findings_count, "email_archives": email_archives,
+            "email_archive_count": len(email_archives),
+            "created": datetime.fromtimestamp(os.path.getctime(case_path)).isoformat()
+        }
+
     def get_evidence_files_for_case(self, case_name: str) -> List[str]:
         """
         Get all evidence files for a case, including both original evidence
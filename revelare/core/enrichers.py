@@ -1,12 +1,39 @@
 import time
-from typing import Dict, Any, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, NamedTuple
 from revelare.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+class AreaCodeRecord(NamedTuple):
+    state: str
+    city: str
+    timezone: str
+
+# Built once at import and shared by every lookup
+_AREA_CODE_DATA: Mapping[str, AreaCodeRecord] = MappingProxyType({
+    '803': AreaCodeRecord('South Carolina', 'Columbia', 'EST'),
+    '212': AreaCodeRecord('New York', 'New York', 'EST'),
+    '310': AreaCodeRecord('California', 'Los Angeles', 'PST'),
+    '312': AreaCodeRecord('Illinois', 'Chicago', 'CST'),
+    '404': AreaCodeRecord('Georgia', 'Atlanta', 'EST'),
+    '415': AreaCodeRecord('California', 'San Francisco', 'PST'),
+    '512': AreaCodeRecord('Texas', 'Austin', 'CST'),
+    '617': AreaCodeRecord('Massachusetts', 'Boston', 'EST'),
+    '713': AreaCodeRecord('Texas', 'Houston', 'CST'),
+    '832': AreaCodeRecord('Texas', 'Houston', 'CST'),
+})
+
 class DataEnricher:
     @staticmethod
     def enrich_area_code(area_code: str) -> Dict[str, Any]:
+        # Results are cached per area code; hand callers a copy so they can't mutate the cache
+        return dict(DataEnricher._enrich_area_code_cached(area_code))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _enrich_area_code_cached(area_code: str) -> Dict[str, Any]:
         try:
             from revelare.utils.data_enhancer import DataEnhancer
             enhancer = DataEnhancer()
@@ -17,26 +44,13 @@ class DataEnricher:
 
     @staticmethod
     def _enrich_area_code_fallback(area_code: str) -> Dict[str, Any]:
-        area_code_data = {
-            '803': {'state': 'South Carolina', 'city': 'Columbia', 'timezone': 'EST'},
-            '212': {'state': 'New York', 'city': 'New York', 'timezone': 'EST'},
-            '310': {'state': 'California', 'city': 'Los Angeles', 'timezone': 'PST'},
-            '312': {'state': 'Illinois', 'city': 'Chicago', 'timezone': 'CST'},
-            '404': {'state': 'Georgia', 'city': 'Atlanta', 'timezone': 'EST'},
-            '415': {'state': 'California', 'city': 'San Francisco', 'timezone': 'PST'},
-            '512': {'state': 'Texas', 'city': 'Austin', 'timezone': 'CST'},
-            '617': {'state': 'Massachusetts', 'city': 'Boston', 'timezone': 'EST'},
-            '713': {'state': 'Texas', 'city': 'Houston', 'timezone': 'CST'},
-            '832': {'state': 'Texas', 'city': 'Houston', 'timezone': 'CST'},
-        }
-
-        if area_code in area_code_data:
-            data = area_code_data[area_code]
+        record = _AREA_CODE_DATA.get(area_code)
+        if record:
             return {
                 'area_code': area_code,
-                'state': data['state'],
-                'city': data['city'],
-                'timezone': data['timezone'],
+                'state': record.state,
+                'city': record.city,
+                'timezone': record.timezone,
                 'country': 'US',
                 'source': 'local_database'
             }
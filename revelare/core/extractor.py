@@ -1,12 +1,16 @@
 import os
 import re
 import time
-from typing import Dict, List, Any
+import bisect
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple
 from urllib.parse import urlparse
 
 from revelare.config.config import Config
 from revelare.utils.logger import get_logger, RevelareLogger
 from revelare.utils.security import SecurityValidator, InputValidator
+from revelare.utils.financial_validators import is_valid_luhn
 from revelare.core.file_processors import (
     TextFileProcessor,
     EmailFileProcessor,
@@ -14,37 +18,59 @@ from revelare.core.file_processors import (
     BinaryFileProcessor,
     ArchiveFileProcessor,
     MediaFileProcessor,
-    DatabaseFileProcessor
+    DatabaseFileProcessor,
+    merge_findings
 )
 
 logger = get_logger(__name__)
 revelare_logger = RevelareLogger.get_logger('extractor')
 
+# Extension category -> processor, in dispatch priority order; anything unmapped is scanned as binary
+_CATEGORY_PROCESSORS = (
+    ('text', TextFileProcessor),
+    ('email', EmailFileProcessor),
+    ('documents', DocumentFileProcessor),
+    ('archives', ArchiveFileProcessor),
+    ('data', DatabaseFileProcessor),
+    ('images', MediaFileProcessor),
+    ('audio', MediaFileProcessor),
+    ('video', MediaFileProcessor),
+)
+
+def _build_extension_map() -> Dict[str, type]:
+    ext_map = {}
+    for category, processor_class in _CATEGORY_PROCESSORS:
+        for ext in Config.ALLOWED_EXTENSIONS.get(category, []):
+            ext_map.setdefault(ext.lower(), processor_class)
+    return ext_map
+
+_EXT_TO_PROCESSOR = _build_extension_map()
+
+@functools.lru_cache(maxsize=65536)
+def _extract_domain(url: str) -> str:
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        if ':' in domain:
+            domain = domain.split(':')[0]
+        return domain
+    except:
+        return "unknown"
+
 def group_urls_by_domain(findings: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
     if 'URLs' not in findings:
         return findings
-    
-    def extract_domain(url: str) -> str:
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            if ':' in domain:
-                domain = domain.split(':')[0]
-            return domain
-        except:
-            return "unknown"
 
+    urls = findings.pop('URLs')
     domain_groups = {}
-    for url, context in findings['URLs'].items():
-        domain = extract_domain(url)
+    for url, context in urls.items():
+        domain = _extract_domain(url)
         domain_groups.setdefault(domain, {})[url] = context
 
-    new_findings = findings.copy()
-    new_findings['URLs_by_Domain'] = domain_groups
-    del new_findings['URLs'] 
+    findings['URLs_by_Domain'] = domain_groups
 
-    logger.info(f"Grouped {len(findings['URLs'])} URLs into {len(domain_groups)} domains")
-    return new_findings
+    logger.info(f"Grouped {len(urls)} URLs into {len(domain_groups)} domains")
+    return findings
 
 def filter_duplicate_emails(findings: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
     if 'Email_Addresses' not in findings:
@@ -58,19 +84,44 @@ def filter_duplicate_emails(findings: Dict[str, Dict[str, str]]) -> Dict[str, Di
     
     filtered_emails = {}
     removed_count = 0
+    # An address with a single '@' can only sit inside another one with the '@' signs aligned, i.e.
+    # its local part is a suffix of the other's and its domain is a prefix of the other's. Index kept
+    # addresses by every prefix of their domain, each bucket sorted by reversed local part: a container's
+    # reversed local part then starts with the candidate's, so one bisect finds it even in a huge bucket.
+    kept_by_domain_prefix = {}
+    kept_irregular = []  # kept addresses without exactly one '@'; never produced by the email regex
     
     for email, context in sorted_emails:
-        is_substring = False
+        local_part, at, domain = email.rpartition('@')
+        if not at or '@' in local_part:
+            # Not a plain single-'@' address; fall back to a full scan
+            container = next((existing for existing in filtered_emails
+                              if email in existing and email != existing), None)
+        else:
+            container = None
+            bucket = kept_by_domain_prefix.get(domain)
+            if bucket:
+                reversed_local = local_part[::-1]
+                i = bisect.bisect_left(bucket, (reversed_local,))
+                if i < len(bucket) and bucket[i][0].startswith(reversed_local):
+                    container = bucket[i][1]
+            if container is None:
+                container = next((existing for existing in kept_irregular
+                                  if email in existing and email != existing), None)
         
-        for existing_email in filtered_emails.keys():
-            if email in existing_email and email != existing_email:
-                is_substring = True
-                removed_count += 1
-                logger.debug(f"Removed duplicate email (substring): {email} (found in {existing_email})")
-                break
+        if container is not None:
+            removed_count += 1
+            # Lazy %-formatting: this runs once per removed email and DEBUG is normally off
+            logger.debug("Removed duplicate email (substring): %s (found in %s)", email, container)
+            continue
         
-        if not is_substring:
-            filtered_emails[email] = context
+        filtered_emails[email] = context
+        if at and '@' not in local_part:
+            entry = (local_part[::-1], email)
+            for end in range(len(domain) + 1):
+                bisect.insort(kept_by_domain_prefix.setdefault(domain[:end], []), entry)
+        else:
+            kept_irregular.append(email)
     
     findings['Email_Addresses'] = filtered_emails
     logger.info(f"Email filtering: removed {removed_count} duplicate/substring emails, kept {len(filtered_emails)}")
@@ -79,7 +130,6 @@ def filter_duplicate_emails(findings: Dict[str, Dict[str, str]]) -> Dict[str, Di
 
 def filter_invalid_credit_cards(findings: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
     """Filter out credit card numbers that fail Luhn validation"""
-    from revelare.utils.financial_validators import is_valid_luhn
     
     cc_categories = ['Credit_Card_VisaMcDiscover', 'Credit_Card_Amex', 'Credit_Card_Numbers']
     total_removed = 0
@@ -100,7 +150,7 @@ def filter_invalid_credit_cards(findings: Dict[str, Dict[str, str]]) -> Dict[str
                 filtered_cards[card_number] = context
             else:
                 removed_count += 1
-                logger.debug(f"Removed invalid credit card (failed Luhn): {card_number[:4]}****")
+                logger.debug("Removed invalid credit card (failed Luhn): %s****", card_number[:4])
         
         findings[category] = filtered_cards
         total_removed += removed_count
@@ -131,28 +181,11 @@ def process_file(file_path: str, findings: Dict[str, Dict[str, str]]) -> bool:
         file_name = os.path.basename(file_path)
         file_ext = os.path.splitext(file_path)[1].lower()
 
-        from revelare.config.config import Config
-        ALLOWED_EXTENSIONS = Config.ALLOWED_EXTENSIONS
-
-        if file_ext in ALLOWED_EXTENSIONS.get('text', []):
-            processor = TextFileProcessor()
-        elif file_ext in ALLOWED_EXTENSIONS.get('email', []):
-            processor = EmailFileProcessor()
-        elif file_ext in ALLOWED_EXTENSIONS.get('documents', []):
-            processor = DocumentFileProcessor()
-        elif file_ext in ALLOWED_EXTENSIONS.get('archives', []):
-            processor = ArchiveFileProcessor()
-        elif file_ext in ALLOWED_EXTENSIONS.get('data', []):
-            processor = DatabaseFileProcessor()
-        elif file_ext in ALLOWED_EXTENSIONS.get('images', []) + ALLOWED_EXTENSIONS.get('audio', []) + ALLOWED_EXTENSIONS.get('video', []):
-            processor = MediaFileProcessor()
-        else:
-            processor = BinaryFileProcessor()
+        processor = _EXT_TO_PROCESSOR.get(file_ext, BinaryFileProcessor)()
 
         file_findings = processor.process_file(file_path, file_name)
 
-        for category, items in file_findings.items():
-            findings.setdefault(category, {}).update(items)
+        merge_findings(findings, file_findings)
 
         logger.info(f"Successfully processed {file_name}")
         return True
@@ -161,8 +194,20 @@ def process_file(file_path: str, findings: Dict[str, Dict[str, str]]) -> bool:
         logger.error(f"Error processing file {file_path}: {e}")
         return False
 
+def _extract_single_file(file_path: str) -> Tuple[bool, Dict[str, Dict[str, str]], float]:
+    """Process one file into its own findings dict. Module-level so worker processes can run it."""
+    file_findings = {}
+    file_start_time = time.time()
+    success = process_file(file_path, file_findings)
+    return success, file_findings, time.time() - file_start_time
+
+def _file_size(file_path: str) -> int:
+    try:
+        return os.path.getsize(file_path)
+    except (OSError, TypeError):
+        return 0
+
 def run_extraction(input_files: List[str]) -> Dict[str, Dict[str, Any]]:
-    from revelare.config.config import Config
     PROGRESS_UPDATE_INTERVAL = getattr(Config, 'PROGRESS_UPDATE_INTERVAL', 10)
     MONITORING_INTERVAL_SECONDS = getattr(Config, 'MONITORING_INTERVAL_SECONDS', 10)
 
@@ -181,23 +226,48 @@ def run_extraction(input_files: List[str]) -> Dict[str, Dict[str, Any]]:
     last_monitor_time = start_time
 
     MAX_FILE_PROCESS_TIME = getattr(Config, 'MAX_FILE_PROCESS_TIME', 300)  # 5 minutes default
-    
-    for i, file_path in enumerate(input_files):
+
+    max_workers = getattr(Config, 'EXTRACTION_WORKERS', os.cpu_count() or 1)
+    executor = None
+    if max_workers > 1 and len(input_files) >= getattr(Config, 'PARALLEL_EXTRACTION_MIN_FILES', 4):
         try:
-            file_name = os.path.basename(file_path)
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # Log start of processing for potentially slow files
-            if file_ext in ['.pdf', '.docx', '.xlsx', '.zip', '.rar', '.7z']:
-                logger.info(f"Starting to process {file_name} ({i+1}/{len(input_files)})...")
-            
-            file_start_time = time.time()
-            
-            # Process file (synchronous - we'll monitor time)
+            executor = ProcessPoolExecutor(max_workers=min(max_workers, len(input_files)))
+            # Submit largest files first so one big archive at the tail doesn't leave the other workers idle
+            futures = [None] * len(input_files)
+            for i in sorted(range(len(input_files)), key=lambda i: _file_size(input_files[i]), reverse=True):
+                futures[i] = executor.submit(_extract_single_file, input_files[i])
+            logger.info(f"Processing files in parallel with {min(max_workers, len(input_files))} worker processes")
+        except Exception as e:
+            logger.warning(f"Could not start worker processes, processing sequentially: {e}")
+            if executor:
+                executor.shutdown(cancel_futures=True)
+            executor = None
+
+    try:
+        for i, file_path in enumerate(input_files):
             try:
-                if process_file(file_path, findings):
+                file_name = os.path.basename(file_path)
+                file_ext = os.path.splitext(file_path)[1].lower()
+                
+                # Log start of processing for potentially slow files
+                if file_ext in {'.pdf', '.docx', '.xlsx', '.zip', '.rar', '.7z'}:
+                    logger.info(f"Starting to process {file_name} ({i+1}/{len(input_files)})...")
+                
+                # Results are merged in input order so later files win on duplicate indicators, as before
+                try:
+                    if executor:
+                        success, file_findings, file_time = futures[i].result()
+                    else:
+                        success, file_findings, file_time = _extract_single_file(file_path)
+                except Exception as e:
+                    logger.error(f"Error processing {file_name}: {e}")
+                    failed_files += 1
+                    continue
+
+                merge_findings(findings, file_findings)
+
+                if success:
                     processed_files += 1
-                    file_time = time.time() - file_start_time
                     if file_time > 10: 
                         logger.info(f"File {file_name} processed in {file_time:.1f}s")
                     # Warn if file took suspiciously long
@@ -205,40 +275,37 @@ def run_extraction(input_files: List[str]) -> Dict[str, Dict[str, Any]]:
                         logger.warning(f"File {file_name} took {file_time:.1f}s to process - this may indicate a problematic file")
                 else:
                     skipped_files += 1
-            except Exception as e:
-                file_time = time.time() - file_start_time
-                logger.error(f"Error processing {file_name} after {file_time:.1f}s: {e}")
-                failed_files += 1
-                continue
-
-            current_time = time.time()
-            
-            # Progress update: every N files OR every N seconds OR if file took > 5 seconds
-            file_time = current_time - file_start_time
-            should_update = (
-                (i + 1) % PROGRESS_UPDATE_INTERVAL == 0 or
-                current_time - last_monitor_time >= MONITORING_INTERVAL_SECONDS or
-                file_time > 5
-            )
-            
-            if should_update:
-                elapsed = current_time - start_time
-                rate = (i + 1) / elapsed if elapsed > 0 else 0
-                total_indicators = sum(len(items) for items in findings.values())
-                remaining = len(input_files) - (i + 1)
-                eta_seconds = remaining / rate if rate > 0 else 0
-                eta_minutes = eta_seconds / 60
+
+                current_time = time.time()
                 
-                progress_msg = f"Progress: {i+1}/{len(input_files)} files processed ({rate:.1f} files/sec, {total_indicators} indicators"
-                if eta_minutes > 0 and rate > 0:
-                    progress_msg += f", ~{eta_minutes:.1f} min remaining"
-                progress_msg += ")"
-                logger.info(progress_msg)
-                last_monitor_time = current_time
+                # Progress update: every N files OR every N seconds OR if file took > 5 seconds
+                should_update = (
+                    (i + 1) % PROGRESS_UPDATE_INTERVAL == 0 or
+                    current_time - last_monitor_time >= MONITORING_INTERVAL_SECONDS or
+                    file_time > 5
+                )
+                
+                if should_update:
+                    elapsed = current_time - start_time
+                    rate = (i + 1) / elapsed if elapsed > 0 else 0
+                    total_indicators = sum(len(items) for items in findings.values())
+                    remaining = len(input_files) - (i + 1)
+                    eta_seconds = remaining / rate if rate > 0 else 0
+                    eta_minutes = eta_seconds / 60
+                    
+                    progress_msg = f"Progress: {i+1}/{len(input_files)} files processed ({rate:.1f} files/sec, {total_indicators} indicators"
+                    if eta_minutes > 0 and rate > 0:
+                        progress_msg += f", ~{eta_minutes:.1f} min remaining"
+                    progress_msg += ")"
+                    logger.info(progress_msg)
+                    last_monitor_time = current_time
 
-        except Exception as e:
-            logger.error(f"Failed to process {file_path}: {e}")
-            failed_files += 1
+            except Exception as e:
+                logger.error(f"Failed to process {file_path}: {e}")
+                failed_files += 1
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
 
     processing_time = time.time() - start_time
 
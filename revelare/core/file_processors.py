@@ -1,5 +1,6 @@
 import os
 import re
+import mmap
 import tempfile
 import zipfile
 from typing import Dict, List, Any, Optional
@@ -9,12 +10,90 @@ from revelare.utils.logger import get_logger
 from revelare.core.validators import DataValidator
 from revelare.core.enrichers import DataEnricher
 from revelare.utils.data_enhancer import DataEnhancer
-from revelare.utils.file_extractor import safe_extract_archive
+from revelare.utils.file_extractor import safe_extract_archive, ARCHIVE_EXTENSIONS
 from revelare.utils.security import SecurityValidator
+from revelare.utils.financial_validators import deobfuscate_text, validate_and_classify_credit_card
 
 logger = get_logger(__name__)
 enhancer = DataEnhancer()
 
+def _compile_patterns() -> Dict[str, re.Pattern]:
+    compiled = {}
+    for category, pattern in Config.REGEX_PATTERNS.items():
+        try:
+            compiled[category] = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error as e:
+            logger.error(f"Invalid regex pattern for {category}: {e}")
+    return compiled
+
+# Compiled once at import and shared by every processor, file and chunk
+_COMPILED_PATTERNS = _compile_patterns()
+
+_TEXT_EXTENSIONS = frozenset(ext.lower() for ext in Config.ALLOWED_EXTENSIONS.get('text', []))
+
+_CREDIT_CARD_CATEGORIES = frozenset({'Credit_Card_VisaMcDiscover', 'Credit_Card_Amex', 'Credit_Card_Numbers'})
+
+# Literals every match of a pattern must contain. A substring test runs in C and is far cheaper than
+# a regex pass, so a chunk missing any of them skips that pattern. Only case-insensitive-safe characters.
+_REQUIRED_LITERALS = {
+    'IPv4': ('.',),
+    'IPv4_with_Port': ('.', ':'),
+    'IPv6': (':',),
+    'URLs': ('://', '.'),
+    'Onion_Addresses': ('.',),
+    'Email_Addresses': ('@', '.'),
+    'Ethereum_Addresses': ('0',),
+    'Monero_Addresses': ('4',),
+    'Unix_Timestamps_Recent': ('1',),
+    'ISO_Timestamps': ('-', ':'),
+    'Device_IDs_UUIDs': ('-',),
+    'User_Agents': ('-', ':'),
+}
+
+# Patterns that cannot match text without at least one digit
+_DIGIT_CATEGORIES = frozenset({
+    'Credit_Card_VisaMcDiscover', 'Credit_Card_Amex', 'Credit_Card_Numbers', 'Bitcoin_Addresses',
+    'IBAN', 'SSN', 'Phone_Numbers', 'Unix_Timestamps',
+})
+_DIGIT_RE = re.compile(r'\d')
+
+# ASCII bytes that are neither printable nor whitespace, i.e. what the printable filter drops
+_NON_PRINTABLE_ASCII = bytes(b for b in range(128) if not (chr(b).isprintable() or chr(b).isspace()))
+
+def _printable_text(chunk: bytes) -> str:
+    """Decode a binary chunk and keep only printable/whitespace characters"""
+    text_chunk = chunk.decode('utf-8', errors='ignore')
+    if text_chunk.isascii():
+        # Pure ASCII: drop control bytes with a C-level translate instead of a per-character loop
+        return text_chunk.encode('ascii').translate(None, _NON_PRINTABLE_ASCII).decode('ascii')
+    return ''.join(c for c in text_chunk if c.isprintable() or c.isspace())
+
+def merge_findings(findings: Dict[str, Dict[str, str]], new_findings: Dict[str, Dict[str, str]]) -> None:
+    """Merge new_findings into findings in place; later values win. Category dicts are adopted, not copied."""
+    for category, items in new_findings.items():
+        existing = findings.get(category)
+        if existing is None:
+            findings[category] = items
+        else:
+            existing.update(items)
+
+def _decode_text(data) -> str:
+    """Decode a bytes-like buffer the way a utf-8 text-mode read with errors='ignore' would"""
+    # Text-mode reads translate newlines, so do the same to keep positions identical
+    return str(data, 'utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+def _read_text_mapped(file_path: str) -> Optional[str]:
+    """
+    Decode a text file straight from an mmap, so the raw bytes are never copied onto the heap
+    next to the decoded string. Returns None if the file can't be mapped (e.g. empty).
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_text(mm)
+    except (OSError, ValueError):
+        return None
+
 class FileProcessor:
     def __init__(self):
         self.logger = get_logger(self.__class__.__name__)
@@ -32,8 +111,8 @@ class TextFileProcessor(FileProcessor):
                 self.logger.error("Invalid file_name provided to TextFileProcessor")
                 return {}
 
-            content = None
-            encodings_to_try = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
+            content = _read_text_mapped(file_path)
+            encodings_to_try = ['utf-8', 'utf-16', 'latin-1', 'cp1252'] if content is None else []
             for encoding in encodings_to_try:
                 try:
                     with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
@@ -52,7 +131,6 @@ class TextFileProcessor(FileProcessor):
                 return {}
 
             # Deobfuscate text before processing (handles [.], (dot), [@], (at), hxxp, etc.)
-            from revelare.utils.financial_validators import deobfuscate_text
             content = deobfuscate_text(content)
 
             return self._find_matches_in_text(content, file_name)
@@ -60,6 +138,14 @@ class TextFileProcessor(FileProcessor):
             self.logger.error(f"Unexpected error processing text file {file_path}: {e}")
             return {}
 
+    def process_bytes(self, data: bytes, file_name: str) -> Dict[str, Dict[str, str]]:
+        """Scan in-memory file contents, decoded the way process_file reads them from disk"""
+        content = _decode_text(data)
+        if not content.strip():
+            self.logger.warning(f"Empty file: {file_name}")
+            return {}
+        return self._find_matches_in_text(deobfuscate_text(content), file_name)
+
     def _find_matches_in_text(self, text: str, file_name: str) -> Dict[str, Dict[str, str]]:
         findings = {}
         if not text or not isinstance(text, str):
@@ -69,16 +155,7 @@ class TextFileProcessor(FileProcessor):
         max_text_size = getattr(Config, 'MAX_TEXT_SIZE_FOR_PROCESSING', 50 * 1024 * 1024)
         chunk_overlap = 1000  # Overlap between chunks to avoid missing indicators at boundaries
         
-        if not hasattr(self, '_compiled_patterns_cache'):
-            self._compiled_patterns_cache = {}
-            for category, pattern in Config.REGEX_PATTERNS.items():
-                try:
-                    self._compiled_patterns_cache[category] = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-                except re.error as e:
-                    self.logger.error(f"Invalid regex pattern for {category}: {e}")
-                    continue
-        
-        compiled_patterns = self._compiled_patterns_cache
+        compiled_patterns = _COMPILED_PATTERNS
         
         # Process in chunks if file is too large
         if len(text) > max_text_size:
@@ -101,8 +178,7 @@ class TextFileProcessor(FileProcessor):
                 )
                 
                 # Merge findings (deduplicate by indicator value)
-                for category, items in chunk_findings.items():
-                    findings.setdefault(category, {}).update(items)
+                merge_findings(findings, chunk_findings)
         else:
             # Process entire file at once
             findings = self._process_text_chunk(text, file_name, 0, compiled_patterns)
@@ -113,9 +189,20 @@ class TextFileProcessor(FileProcessor):
                            compiled_patterns: Dict[str, re.Pattern]) -> Dict[str, Dict[str, str]]:
         """Process a chunk of text and return findings"""
         findings = {}
+        has_digit = None
         
         for category, compiled_pattern in compiled_patterns.items():
+            if any(literal not in text for literal in _REQUIRED_LITERALS.get(category, ())):
+                continue
+            if category in _DIGIT_CATEGORIES:
+                if has_digit is None:
+                    has_digit = _DIGIT_RE.search(text) is not None
+                if not has_digit:
+                    continue
+
             seen_indicators = set()
+            is_ip_category = "IP" in category
+            is_card_category = category in _CREDIT_CARD_CATEGORIES
             try:
                 for match in compiled_pattern.finditer(text):
                     indicator = match.group(0).strip()
@@ -123,37 +210,28 @@ class TextFileProcessor(FileProcessor):
                         continue
                     seen_indicators.add(indicator)
                     
+                    # Relevance only depends on the value, so skip building an EnhancedIndicator
+                    # (and slicing its surrounding context) for every match
+                    if enhancer.is_irrelevant_value(indicator, category):
+                        continue
+
                     # Calculate absolute position including offset
                     absolute_position = offset + match.start()
 
-                    enhanced = enhancer.create_enhanced_indicator(
-                        indicator=indicator, category=category,
-                        context=text[max(0, match.start()-100):match.end()+100],
-                        file_name=file_name, position=absolute_position
-                    )
-
-                    if enhancer.is_irrelevant(enhanced):
-                        continue
-
-                    context_parts = [
-                        f"File: {file_name}",
-                        f"Position: {absolute_position}"
-                    ]
+                    context = f"File: {file_name} | Position: {absolute_position}"
                     
-                    if "IP" in category:
-                        context_parts.append(f"Type: {DataValidator.classify_ip(indicator)}")
+                    if is_ip_category:
+                        context += f" | Type: {DataValidator.classify_ip(indicator)}"
                     
                     # Validate credit cards with Luhn algorithm
-                    if category in ['Credit_Card_VisaMcDiscover', 'Credit_Card_Amex', 'Credit_Card_Numbers']:
-                        from revelare.utils.financial_validators import validate_and_classify_credit_card
+                    if is_card_category:
                         validation = validate_and_classify_credit_card(indicator)
                         if not validation['is_valid_luhn']:
                             # Skip invalid credit card numbers (likely false positives)
                             continue
-                        context_parts.append(f"Issuer: {validation['issuer']}")
-                        context_parts.append("Luhn: Valid")
+                        context += f" | Issuer: {validation['issuer']} | Luhn: Valid"
                     
-                    findings.setdefault(category, {})[indicator] = " | ".join(context_parts)
+                    findings.setdefault(category, {})[indicator] = context
             except Exception as e:
                 self.logger.warning(f"Error processing pattern {category} for {file_name}: {e}")
                 continue
@@ -163,7 +241,7 @@ class TextFileProcessor(FileProcessor):
 class EmailFileProcessor(FileProcessor):
     def process_file(self, file_path: str, file_name: str) -> Dict[str, Dict[str, str]]:
         file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext in ['.eml', '.mbox', '.mbx']:
+        if file_ext in {'.eml', '.mbox', '.mbx'}:
             return TextFileProcessor().process_file(file_path, file_name)
         return BinaryFileProcessor().process_file(file_path, file_name)
 
@@ -178,11 +256,11 @@ class DocumentFileProcessor(FileProcessor):
                     reader = pypdf.PdfReader(f)
                     for page in reader.pages:
                         content += (page.extract_text() or "") + "\n"
-            elif file_ext in ['.docx', '.doc']:
+            elif file_ext in {'.docx', '.doc'}:
                 from docx import Document
                 doc = Document(file_path)
                 content = "\n".join(p.text for p in doc.paragraphs)
-            elif file_ext in ['.xlsx', '.xls']:
+            elif file_ext in {'.xlsx', '.xls'}:
                 import pandas as pd
                 df_dict = pd.read_excel(file_path, sheet_name=None)
                 for sheet_name, df in df_dict.items():
@@ -200,21 +278,24 @@ class BinaryFileProcessor(FileProcessor):
         findings = {}
         try:
             with open(file_path, 'rb') as f:
-                chunk_num = 0
-                while True:
-                    chunk = f.read(Config.BINARY_CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    chunk_num += 1
-                    try:
-                        text_chunk = chunk.decode('utf-8', errors='ignore')
-                        printable_chunk = ''.join(c for c in text_chunk if c.isprintable() or c.isspace())
-                        if printable_chunk.strip():
-                            chunk_findings = TextFileProcessor()._find_matches_in_text(printable_chunk, f"{file_name}_chunk_{chunk_num}")
-                            for category, items in chunk_findings.items():
-                                findings.setdefault(category, {}).update(items)
-                    except Exception as e:
-                        self.logger.debug(f"Error processing binary chunk {chunk_num}: {e}")
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size == 0:
+                    return findings
+                scanner = TextFileProcessor()
+                window_size = Config.BINARY_CHUNK_SIZE + max(Config.BINARY_CHUNK_OVERLAP, 0)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for chunk_num, chunk_start in enumerate(range(0, file_size, Config.BINARY_CHUNK_SIZE), 1):
+                        # Each window runs into the next chunk; matches seen twice collapse on the indicator key
+                        chunk = mm[chunk_start:chunk_start + window_size]
+                        try:
+                            printable_chunk = _printable_text(chunk)
+                            if printable_chunk.strip():
+                                chunk_findings = scanner._process_text_chunk(
+                                    printable_chunk, f"{file_name}_chunk_{chunk_num}", 0, _COMPILED_PATTERNS
+                                )
+                                merge_findings(findings, chunk_findings)
+                        except Exception as e:
+                            self.logger.debug(f"Error processing binary chunk {chunk_num}: {e}")
         except Exception as e:
             self.logger.error(f"Error processing binary file {file_path}: {e}")
         return findings
@@ -238,6 +319,11 @@ class ArchiveFileProcessor(FileProcessor):
         
         # processed_archives.add(normalized_path) # safe_extract_archive adds it
         
+        in_memory_findings = self._process_text_zip_in_memory(file_path, file_name)
+        if in_memory_findings is not None:
+            processed_archives.add(normalized_path)
+            return in_memory_findings
+
         try:
             from revelare.utils.file_extractor import TemporaryDirectory_in_script_dir
             with TemporaryDirectory_in_script_dir(prefix=f"revelare_archive_{os.path.basename(file_name)}_") as temp_dir:
@@ -265,7 +351,7 @@ class ArchiveFileProcessor(FileProcessor):
                         # to a subdir. We can skip processing the raw archive file to avoid duplication 
                         # and let the loop find the extracted contents.
                         ext = os.path.splitext(target_path)[1].lower()
-                        if ext in ['.zip', '.rar', '.7z', '.tar', '.gz']:
+                        if ext in ARCHIVE_EXTENSIONS:
                              continue
                         
                         # Process the file (text, doc, binary, etc.)
@@ -275,6 +361,35 @@ class ArchiveFileProcessor(FileProcessor):
             self.logger.error(f"Error processing archive {file_name}: {e}")
         return findings
 
+    def _process_text_zip_in_memory(self, file_path: str, file_name: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Scan a zip whose members are all plain text straight from memory, skipping the temp-dir round trip.
+        Returns None when the archive needs the regular extraction path (nested archives, binaries,
+        documents, encrypted or oversized members).
+        """
+        if os.path.splitext(file_path)[1].lower() != '.zip':
+            return None
+
+        max_member_size = getattr(Config, 'ZIP_IN_MEMORY_MAX_MEMBER_SIZE', 8 * 1024 * 1024)
+        try:
+            with zipfile.ZipFile(file_path, 'r') as zip_ref:
+                members = [info for info in zip_ref.infolist() if not info.is_dir()]
+                for info in members:
+                    if (info.flag_bits & 0x1 or info.file_size > max_member_size or
+                            os.path.splitext(info.filename)[1].lower() not in _TEXT_EXTENSIONS):
+                        return None
+
+                findings = {}
+                processor = TextFileProcessor()
+                for info in members:
+                    member_name = os.path.basename(info.filename)
+                    merge_findings(findings, processor.process_bytes(zip_ref.read(info), member_name))
+                    self.logger.info(f"Successfully processed {member_name}")
+                return findings
+        except Exception as e:
+            self.logger.debug(f"In-memory zip scan unavailable for {file_name}, extracting instead: {e}")
+            return None
+
 class MediaFileProcessor(FileProcessor):
     def process_file(self, file_path: str, file_name: str) -> Dict[str, Dict[str, str]]:
         findings = {}
@@ -283,7 +398,7 @@ class MediaFileProcessor(FileProcessor):
         # Binary scanning would find UUIDs and other patterns in embedded JSON/metadata
         # which is not useful for actual image files
         ext = os.path.splitext(file_path)[1].lower()
-        if ext in ['.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp', '.bmp', '.gif']:
+        if ext in {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp', '.bmp', '.gif'}:
             try:
                 from revelare.core.metadata_extractor import MetadataExtractor
                 metadata = MetadataExtractor.extract_image_metadata(file_path)
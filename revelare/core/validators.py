@@ -1,59 +1,70 @@
 import re
+import socket
+import functools
 from typing import Optional, Dict, Any
+from revelare.config.config import Config
 from revelare.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_NON_DIGIT_PLUS = re.compile(r'[^\d+]')
+_NON_DIGIT = re.compile(r'[^\d]')
+# classify_ip lookup tables: most ranges are decided by the first octet alone; None defers to the second octet
+_FIRST_OCTET_CLASS = tuple(
+    "Reserved/Bogus" if octet == 0 else
+    "Private" if octet == 10 else
+    "Loopback" if octet == 127 else
+    None if octet in (169, 172, 192) else
+    "Multicast" if 224 <= octet <= 239 else
+    "Reserved" if octet >= 240 else
+    "Public"
+    for octet in range(256)
+)
+_SECOND_OCTET_CLASS = {
+    169: {254: "Link-Local"},
+    172: {octet: "Private" for octet in range(16, 32)},
+    192: {168: "Private"},
+}
+_EMAIL_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9._%+\-]*@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}')
+_INVALID_AREA_CODES = frozenset({'555', '000', '111', '222', '333', '444', '666', '777', '888', '999'})
+_INVALID_SSN_AREAS = frozenset({'000', '666'})
+
 class DataValidator:
     @staticmethod
     def is_valid_email(email: str) -> bool:
-        if not email or len(email) < 5:
-            return False
-        if not email[0].isalnum() or '@' not in email or '.' not in email.split('@')[1]:
-            return False
-        return True
+        return bool(email) and len(email) >= 5 and _EMAIL_RE.fullmatch(email) is not None
 
     @staticmethod
     def is_valid_phone(phone: str) -> bool:
         if not phone:
             return False
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = _NON_DIGIT_PLUS.sub('', phone)
         if cleaned.startswith('+1'):
             cleaned = cleaned[2:]
         elif cleaned.startswith('1') and len(cleaned) in [10, 11]:
             cleaned = cleaned[1:]
         
-        if len(cleaned) != 10 or not cleaned.isdigit():
+        # cleaned only holds digits and '+', so a stray '+' is the only non-digit left to reject
+        if len(cleaned) != 10 or '+' in cleaned or not '2' <= cleaned[0] <= '9':
             return False
         
-        if int(cleaned[0]) < 2:
-            return False
-        
-        return DataValidator.is_valid_area_code(cleaned[:3])
+        return cleaned[:3] in _VALID_AREA_CODES
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def is_valid_area_code(area_code: str) -> bool:
-        if not area_code.isdigit() or len(area_code) != 3:
+        if len(area_code) != 3 or not area_code.isdigit():
             return False
-        
-        first_digit = int(area_code[0])
-        if first_digit in [0, 1]:
-            return False
-        
-        invalid_codes = ['555', '000', '111', '222', '333', '444', '666', '777', '888', '999']
-        if area_code in invalid_codes:
-            return False
-            
-        return True
+        return '2' <= area_code[0] <= '9' and area_code not in _INVALID_AREA_CODES
 
     @staticmethod
     def is_valid_ssn(ssn: str) -> bool:
         if not ssn:
             return False
-        cleaned = re.sub(r'[^\d]', '', ssn)
+        cleaned = _NON_DIGIT.sub('', ssn)
         if len(cleaned) != 9:
             return False
-        if cleaned.startswith('000') or cleaned.startswith('666') or int(cleaned[:3]) >= 900:
+        if cleaned[0] == '9' or cleaned[:3] in _INVALID_SSN_AREAS:
             return False
         if cleaned[3:5] == '00':
             return False
@@ -62,29 +73,26 @@ class DataValidator:
         return True
 
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def classify_ip(ip: str) -> str:
+        address = ip.split(':', 1)[0]
         try:
-            if ':' in ip:
-                ip = ip.split(':')[0]
-            parts = ip.split('.')
-            if len(parts) != 4:
+            n = int.from_bytes(socket.inet_pton(socket.AF_INET, address), 'big')
+        except (OSError, ValueError):
+            # inet_pton rejects zero-padded octets ("010.0.0.1") that the IPv4 pattern extracts
+            try:
+                octets = [int(part) for part in address.split('.')]
+            except ValueError:
                 return "Invalid"
-            octets = [int(part) for part in parts]
-            if any(not 0 <= octet <= 255 for octet in octets):
+            if len(octets) != 4 or any(not 0 <= octet <= 255 for octet in octets):
                 return "Invalid"
-            
-            first_octet = octets[0]
-            if first_octet == 0: return "Reserved/Bogus"
-            elif first_octet == 10: return "Private"
-            elif first_octet == 127: return "Loopback"
-            elif first_octet == 169 and octets[1] == 254: return "Link-Local"
-            elif first_octet == 172 and 16 <= octets[1] <= 31: return "Private"
-            elif first_octet == 192 and octets[1] == 168: return "Private"
-            elif 224 <= first_octet <= 239: return "Multicast"
-            elif 240 <= first_octet <= 255: return "Reserved"
-            else: return "Public"
-        except Exception:
-            return "Invalid"
+            n = int.from_bytes(bytes(octets), 'big')
+
+        first_octet = n >> 24
+        label = _FIRST_OCTET_CLASS[first_octet]
+        if label is None:
+            label = _SECOND_OCTET_CLASS[first_octet].get((n >> 16) & 0xFF, "Public")
+        return label
 
     @staticmethod
     def is_valid_routing_number(routing_number: str) -> bool:
@@ -99,10 +107,13 @@ class DataValidator:
         if checksum % 10 != 0:
             return False
 
-        from revelare.config.config import Config
         return routing_number in Config.ROUTING_NUMBERS
 
     @staticmethod
     def get_routing_number_info(routing_number: str) -> Optional[str]:
-        from revelare.config.config import Config
-        return Config.ROUTING_NUMBERS.get(routing_number)
\ No newline at end of file
+        return Config.ROUTING_NUMBERS.get(routing_number)
+
+# Only 1000 three-digit codes exist, so evaluate the area-code rules once and make phone checks a set lookup
+_VALID_AREA_CODES = frozenset(
+    code for code in (f'{n:03d}' for n in range(1000)) if DataValidator.is_valid_area_code(code)
+)
\ No newline at end of file
@@ -43,10 +43,10 @@ class DataEnhancer:
     def is_irrelevant(self, indicator: EnhancedIndicator) -> bool:
         if not indicator:
             return True
-        
-        value = indicator.value
-        category = indicator.category
-        
+        return self.is_irrelevant_value(indicator.value, indicator.category)
+
+    def is_irrelevant_value(self, value: str, category: str) -> bool:
+        """Relevance check on the raw value, so callers can filter before building an EnhancedIndicator"""
         filter_map = {
             'IPv4': 'Common_Irrelevant_IPs',
             'URLs': 'Common_Irrelevant_URLs',
@@ -56,7 +56,8 @@ class DataEnhancer:
         if category in filter_map:
             for pattern in self.compiled_filters.get(filter_map[category], []):
                 if pattern.search(value):
-                    logger.debug(f"Filtered out irrelevant {category}: {value}")
+                    # Lazy %-formatting: called for every regex match, with DEBUG normally off
+                    logger.debug("Filtered out irrelevant %s: %s", category, value)
                     return True
 
         if len(value) < 5 and category not in ['IPv4']:
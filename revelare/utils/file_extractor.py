@@ -1,4 +1,5 @@
 import os
+import errno
 import shutil
 import zipfile
 import tempfile
@@ -6,6 +7,7 @@ import stat
 import re
 import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 from pathlib import Path
 from datetime import timezone
@@ -15,6 +17,13 @@ from revelare.utils.logger import get_logger, RevelareLogger
 from revelare.utils.security import SecurityValidator
 from revelare.config.config import Config
 
+# Extensions treated as (possibly nested) archives during recursive extraction
+ARCHIVE_EXTENSIONS = frozenset({'.zip', '.rar', '.7z', '.tar', '.gz'})
+
+ZIP_EXTRACTION_WORKERS = min(8, os.cpu_count() or 1)
+# Zips with fewer members than this go through a plain extractall on the already-open handle
+ZIP_PARALLEL_MIN_MEMBERS = 64
+
 logger = RevelareLogger.get_logger(__name__)
 
 def get_script_temp_dir() -> str:
@@ -99,6 +108,30 @@ def normalize_file_path(file_path: str, case_name: str = None) -> Tuple[str, str
     
     return file_path, original_path
 
+def _move_file(src: str, dst: str) -> None:
+    """Rename in a single syscall; copy (keeping timestamps) and unlink only across filesystems"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.unlink(src)
+
+def _base_26_suffixes():
+    """Yield A..Z, AA..AZ, BA..ZZ, AAA... by incrementing the previous suffix in place"""
+    letters = [0]
+    while True:
+        yield ''.join(chr(65 + d) for d in letters)
+        pos = len(letters) - 1
+        while pos >= 0 and letters[pos] == 25:
+            letters[pos] = 0
+            pos -= 1
+        if pos < 0:
+            letters.insert(0, 0)
+        else:
+            letters[pos] += 1
+
 def extract_and_rename_files(source_dir: str, project_prefix: str, output_dir: str) -> Dict[str, str]:
     file_mapping = {}
     if not os.path.isdir(source_dir):
@@ -115,26 +148,17 @@ def extract_and_rename_files(source_dir: str, project_prefix: str, output_dir: s
     
     logger.info(f"Found {len(files_to_move)} files to process in {source_dir}")
     
-    for i, file_path in enumerate(files_to_move):
+    for file_path, base_26_suffix in zip(files_to_move, _base_26_suffixes()):
         try:
             relative_path = os.path.relpath(file_path, source_dir)
             original_basename = os.path.basename(relative_path)
             
-            index = i
-            base_26_suffix = ""
-            while True:
-                base_26_suffix = chr(65 + (index % 26)) + base_26_suffix
-                index //= 26
-                if index == 0:
-                    break
-                index -= 1
-            
             _, original_ext = os.path.splitext(original_basename)
             short_name = f"{project_prefix}_{base_26_suffix}{original_ext}"
             new_path = os.path.join(output_dir, short_name)
             
             if file_path != new_path:
-                shutil.move(file_path, new_path)
+                _move_file(file_path, new_path)
             
             file_mapping[relative_path] = short_name
             
@@ -146,6 +170,30 @@ def extract_and_rename_files(source_dir: str, project_prefix: str, output_dir: s
     cleanup_temp_files(source_dir)
     return file_mapping
 
+def _extract_zip_batch(archive_path: str, members: List[zipfile.ZipInfo], extract_to: str) -> None:
+    # Each worker needs its own handle (ZipFile shares one file position between readers), but opening
+    # one re-reads the central directory, so a worker opens the archive once for its whole batch
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        for member in members:
+            try:
+                zip_ref.extract(member, extract_to)
+            except FileExistsError:
+                # Another worker created the same parent directory between zipfile's exists check and makedirs
+                zip_ref.extract(member, extract_to)
+
+def _extract_zip_members(archive_path: str, members: List[zipfile.ZipInfo], extract_to: str) -> None:
+    """Extract zip members in parallel, one contiguous batch per thread; zlib releases the GIL while inflating"""
+    workers = min(ZIP_EXTRACTION_WORKERS, len(members))
+    if workers <= 1:
+        _extract_zip_batch(archive_path, members, extract_to)
+        return
+    batch_size = -(-len(members) // workers)
+    batches = [members[i:i + batch_size] for i in range(0, len(members), batch_size)]
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        futures = [executor.submit(_extract_zip_batch, archive_path, batch, extract_to) for batch in batches]
+        for future in futures:
+            future.result()
+
 def extract_archive_single(archive_path: str, extract_to: str) -> bool:
     """
     Extract a single archive file (zip, 7z, rar, etc.) to the target directory.
@@ -162,7 +210,12 @@ def extract_archive_single(archive_path: str, extract_to: str) -> bool:
                     if info.flag_bits & 0x1:
                         logger.warning(f"Skipping encrypted zip file (password protected): {archive_path}")
                         return False
-                zip_ref.extractall(extract_to)
+                if len(zip_ref.infolist()) < ZIP_PARALLEL_MIN_MEMBERS or ZIP_EXTRACTION_WORKERS <= 1:
+                    zip_ref.extractall(extract_to)
+                    return True
+                # Last entry wins for duplicate names, as with extractall
+                members = list({info.filename: info for info in zip_ref.infolist()}.values())
+            _extract_zip_members(archive_path, members, extract_to)
             return True
         except RuntimeError as e:
             if 'password' in str(e).lower() or 'encrypted' in str(e).lower():
@@ -274,7 +327,7 @@ def safe_extract_archive(archive_path: str, extract_to: str, depth: int = 0, pro
                 
                 if os.path.isfile(file_path):
                     file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext in ['.zip', '.rar', '.7z', '.tar', '.gz']:
+                    if file_ext in ARCHIVE_EXTENSIONS:
                         # Only add if we haven't processed it yet
                         if normalized_path not in processed_archives:
                             extracted_archives.append(file_path)
@@ -301,8 +354,7 @@ def safe_extract_archive(archive_path: str, extract_to: str, depth: int = 0, pro
 
 def get_file_info(file_path: str) -> Dict[str, Any]:
     try:
-        file_path_obj = Path(file_path)
-        stat_result = file_path_obj.stat()
+        stat_result = os.stat(file_path)
         
         return {
             "size_bytes": stat_result.st_size,
@@ -314,11 +366,36 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
         logger.error(f"Error getting file info for {file_path}: {e}")
         return {"error": str(e)}
 
+def _is_reparse_point(entry: os.DirEntry) -> bool:
+    """True for Windows junctions and other reparse points, which is_dir(follow_symlinks=False) reports as dirs"""
+    if os.name != 'nt':
+        return False
+    return bool(entry.stat(follow_symlinks=False).st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def _fast_rmtree(path: str) -> None:
+    """Plain scandir-based recursive delete; symlinks and junctions are removed, never followed"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if _is_reparse_point(entry):
+                    # Removes the junction itself, leaving its target outside the temp tree untouched
+                    os.rmdir(entry.path)
+                else:
+                    _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
 def cleanup_temp_files(temp_path: str) -> bool:
     if not temp_path or not os.path.exists(temp_path):
         return True
     try:
-        shutil.rmtree(temp_path)
+        try:
+            _fast_rmtree(temp_path)
+        except OSError:
+            # Read-only entries, races with other cleaners, etc.: let shutil handle what's left
+            if os.path.exists(temp_path):
+                shutil.rmtree(temp_path)
         logger.info(f"Cleaned up temporary path: {temp_path}")
         return True
     except Exception as e:
@@ -1,17 +1,84 @@
 import os
-import time
+import mmap
 import requests
 import logging
+import functools
+import socket
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List, Any
 
 from revelare.config.config import Config
 from revelare.utils.logger import get_logger, RevelareLogger
 from revelare.utils.security import InputValidator
+from revelare.utils.rate_limiter import TokenBucket
+from revelare.utils.response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # let requests raise its own (RequestException-derived) error
+    return response.json()
 
 logger = get_logger(__name__)
 api_logger = RevelareLogger.get_logger('api_client')
 perf_logger = RevelareLogger.get_logger('performance')
 
+# Local MMDB results by ((asn db identity, city db identity), ip); cleared wholesale when full
+_LOCAL_LOOKUP_CACHE_SIZE = 131072
+_LOCAL_LOOKUP_CACHE: Dict[tuple, Optional[Dict[str, Any]]] = {}
+
+def _db_identity(path: str) -> tuple:
+    try:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (path, None, None)
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """numpy if installed, or None; imported on first use so startup never pays for it"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+# IPv4 ranges that are private, loopback, reserved or multicast, as (network, mask) integers
+_V4_NON_GLOBAL = tuple(
+    (int(net.network_address), int(net.netmask))
+    for net in map(ipaddress.ip_network, [
+        '0.0.0.0/8', '10.0.0.0/8', '127.0.0.0/8', '169.254.0.0/16', '172.16.0.0/12',
+        '192.0.0.0/29', '192.0.0.170/31', '192.0.2.0/24', '192.168.0.0/16', '198.18.0.0/15',
+        '198.51.100.0/24', '203.0.113.0/24', '224.0.0.0/4', '240.0.0.0/4', '255.255.255.255/32',
+    ])
+)
+
+@functools.lru_cache(maxsize=131072)
+def _is_non_global_ip(ip: str) -> bool:
+    try:
+        ip_int = int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+    except (OSError, ValueError, TypeError):
+        ip_int = None
+    if ip_int is not None:
+        return any(ip_int & mask == network for network, mask in _V4_NON_GLOBAL)
+
+    try:
+        addr = ipaddress.ip_address(ip)
+        return addr.is_private or addr.is_loopback or addr.is_reserved or addr.is_multicast
+    except ValueError:
+        return True
+
 class GeoIPService:
     def __init__(self):
         self.asn_db_path = self._find_mmdb_file("GeoLite2-ASN.mmdb")
@@ -20,13 +87,29 @@ class GeoIPService:
         self.api_url = "http://ip-api.com/json/"
         self.api_rate_limit = getattr(Config, 'IP_API_RATE_LIMIT', 0.5)
         self.api_timeout = getattr(Config, 'IP_API_TIMEOUT', 15)
-        self.last_api_request_time = 0.0
+        self.max_workers = max(1, getattr(Config, 'GEOIP_MAX_WORKERS', 8))
+        self._api_bucket = TokenBucket.from_interval(self.api_rate_limit)
+        self._session = self._build_session()
+        self._api_cache = ResponseCache(Config.API_CACHE_DATABASE, 'geoip', getattr(Config, 'GEOIP_CACHE_TTL', 86400))
         
         self.validator = InputValidator()
         self.asn_reader = None
         self.city_reader = None
         self._initialize_databases()
+        self._db_key = (_db_identity(self.asn_db_path), _db_identity(self.city_db_path))
     
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Pooled keep-alive session so consecutive API lookups reuse one connection"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.2,
+                                                status_forcelist=[429, 500, 502, 503, 504]))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+
     def _find_mmdb_file(self, filename: str) -> str:
         """Search for MMDB files in common locations"""
         # Check config path first if set
@@ -62,12 +145,14 @@ class GeoIPService:
             import maxminddb
             if os.path.exists(self.asn_db_path):
                 self.asn_reader = maxminddb.open_database(self.asn_db_path)
+                self._advise_random_access(self.asn_reader)
                 logger.info(f"ASN database initialized: {self.asn_db_path}")
             else:
                  logger.warning(f"ASN database not found: {self.asn_db_path}")
             
             if os.path.exists(self.city_db_path):
                 self.city_reader = maxminddb.open_database(self.city_db_path)
+                self._advise_random_access(self.city_reader)
                 logger.info(f"City database initialized: {self.city_db_path}")
             else:
                 logger.warning(f"City database not found: {self.city_db_path}")
@@ -76,6 +161,20 @@ class GeoIPService:
         except Exception as e:
             logger.error(f"Error initializing GeoLite2 databases: {e}")
             
+    @staticmethod
+    def _advise_random_access(reader):
+        """
+        MMDB lookups jump around the search tree, so sequential readahead mostly pulls in pages that
+        are never used. Only the pure-Python reader exposes its mmap; the C extension (preferred by
+        MODE_AUTO when installed) manages its own mapping and is left as-is.
+        """
+        buffer = getattr(reader, '_buffer', None)
+        if isinstance(buffer, mmap.mmap) and hasattr(mmap, 'MADV_RANDOM'):
+            try:
+                buffer.madvise(mmap.MADV_RANDOM)
+            except OSError as e:
+                logger.debug(f"madvise(MADV_RANDOM) failed on MaxMind database: {e}")
+
     def close(self):
         try:
             if self.asn_reader:
@@ -84,6 +183,8 @@ class GeoIPService:
                 self.city_reader.close()
         except Exception as e:
             logger.error(f"Error closing MaxMind databases: {e}")
+        self._session.close()
+        self._api_cache.close()
             
     def __enter__(self):
         return self
@@ -92,41 +193,81 @@ class GeoIPService:
         self.close()
 
     def enrich_ips(self, ip_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        unique_ips = sorted(set(ip_addresses))
+        
+        # Extract IP from IP:port format
+        ip_for = {ip_with_port: ip_with_port.split(':')[0] if ':' in ip_with_port else ip_with_port
+                  for ip_with_port in unique_ips}
+        global_ips = self._global_ips(list(dict.fromkeys(ip_for.values())))
+        
+        # Local MMDB lookups run in parallel; only misses go to the rate-limited API, whose
+        # token bucket lets the workers overlap network latency without exceeding the limit
+        data_for = {}
+        if global_ips:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(global_ips))) as executor:
+                data_for = dict(zip(global_ips, executor.map(self._lookup_local, global_ips)))
+                api_ips = [ip for ip, data in data_for.items() if not data]
+                data_for.update(zip(api_ips, executor.map(self._lookup_api, api_ips)))
+        
         enriched_ips = {}
-        unique_ips = sorted(list(set(ip_addresses)))
+        for ip_with_port, ip in ip_for.items():
+            if ip not in data_for:
+                enriched_ips[ip_with_port] = {'error': 'Invalid or non-global IP address'}
+            else:
+                # Copy so IP:port variants of one address don't share a dict
+                enriched_ips[ip_with_port] = dict(data_for[ip] or {'error': 'No data available'})
         
-        for ip_with_port in unique_ips:
-            # Extract IP from IP:port format
-            ip = ip_with_port.split(':')[0] if ':' in ip_with_port else ip_with_port
-            
-            if not self.validator.is_valid_ip(ip) or self._is_non_global_ip(ip):
-                 enriched_ips[ip_with_port] = {'error': 'Invalid or non-global IP address'}
-                 continue
+        return enriched_ips
 
-            local_data = self._lookup_local(ip)
-            if local_data:
-                enriched_ips[ip_with_port] = local_data
+    def _global_ips(self, ips: List[str]) -> List[str]:
+        """Valid, globally routable IPs from ips, in order"""
+        np = _numpy()
+        if np is None:
+            return [ip for ip in ips if self.validator.is_valid_ip(ip) and not self._is_non_global_ip(ip)]
+        
+        # Dotted-quad IPv4 (the bulk of any case) is range-checked in one vectorised pass;
+        # anything inet_pton rejects goes through the full validator
+        packed, is_global = [], {}
+        for ip in ips:
+            try:
+                packed.append(socket.inet_pton(socket.AF_INET, ip))
+            except (OSError, ValueError, TypeError):
+                is_global[ip] = self.validator.is_valid_ip(ip) and not self._is_non_global_ip(ip)
             else:
-                api_data = self._lookup_api(ip)
-                if api_data:
-                    enriched_ips[ip_with_port] = api_data
-                else:
-                    enriched_ips[ip_with_port] = {'error': 'No data available'}
+                is_global[ip] = None
         
-        return enriched_ips
+        if packed:
+            ip_ints = np.frombuffer(b''.join(packed), dtype='>u4')
+            non_global = np.zeros(len(ip_ints), dtype=bool)
+            for network, mask in _V4_NON_GLOBAL:
+                non_global |= (ip_ints & mask) == network
+            v4_flags = iter((~non_global).tolist())
+            for ip, flag in is_global.items():
+                if flag is None:
+                    is_global[ip] = next(v4_flags)
+        
+        return [ip for ip in ips if is_global[ip]]
 
     def _is_non_global_ip(self, ip: str) -> bool:
-        try:
-            from ipaddress import ip_address
-            addr = ip_address(ip)
-            return addr.is_private or addr.is_loopback or addr.is_reserved or addr.is_multicast
-        except ValueError:
-            return True
+        return _is_non_global_ip(ip)
 
     def _lookup_local(self, ip: str) -> Optional[Dict[str, Any]]:
         if not self.asn_reader and not self.city_reader:
             return None
         
+        # Shared across instances (reporting opens a new service per batch) and keyed on the
+        # database files' identity, so an updated MMDB never serves stale entries
+        cache_key = (self._db_key, ip)
+        try:
+            result = _LOCAL_LOOKUP_CACHE[cache_key]
+        except KeyError:
+            result = self._lookup_readers(ip)
+            if len(_LOCAL_LOOKUP_CACHE) >= _LOCAL_LOOKUP_CACHE_SIZE:
+                _LOCAL_LOOKUP_CACHE.clear()
+            _LOCAL_LOOKUP_CACHE[cache_key] = result
+        return dict(result) if result else None
+
+    def _lookup_readers(self, ip: str) -> Optional[Dict[str, Any]]:
         try:
             result = {'query': ip, 'source': 'GeoLite2'}
             
@@ -160,24 +301,28 @@ class GeoIPService:
             return None
 
     def _lookup_api(self, ip: str) -> Optional[Dict[str, str]]:
-        elapsed = time.time() - self.last_api_request_time
-        if elapsed < self.api_rate_limit:
-            time.sleep(self.api_rate_limit - elapsed)
+        # Answers from earlier runs skip both the request and the rate limiter
+        cached = self._api_cache.get(ip)
+        if cached is not None:
+            return cached
+
+        self._api_bucket.acquire()
             
         try:
-            response = requests.get(f"{self.api_url}{ip}", timeout=self.api_timeout)
-            self.last_api_request_time = time.time()
+            response = self._session.get(f"{self.api_url}{ip}", timeout=self.api_timeout)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get('status') == 'success':
-                    return {
+                    result = {
                         'country': data.get('country'), 'region': data.get('regionName'),
                         'city': data.get('city'), 'isp': data.get('isp'),
                         'organization': data.get('org'), 'as': data.get('as'),
                         'lat': str(data.get('lat')), 'lon': str(data.get('lon')),
                         'query': data.get('query'), 'source': 'ip-api.com'
                     }
+                    self._api_cache.set(ip, result)
+                    return result
                 else:
                     logger.warning(f"API failed for {ip}: {data.get('message')}")
                     return None
@@ -1,4 +1,8 @@
 import logging
+import logging.handlers
+import queue
+import atexit
+import multiprocessing
 import sys
 import os
 from typing import Optional, Dict, Any
@@ -8,6 +12,7 @@ class RevelareLogger:
     _instance: Optional['RevelareLogger'] = None
     _logger: Optional[logging.Logger] = None
     _is_setup = False
+    _sublogger_cache: Dict[str, logging.Logger] = {}
     
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -44,13 +49,40 @@ class RevelareLogger:
             file_handler = logging.FileHandler(log_file_path, mode='a', encoding='utf-8')
             file_handler.setLevel(logging.DEBUG) 
             file_handler.setFormatter(formatter)
-            self._logger.addHandler(file_handler)
+            self._add_file_handler(file_handler)
         except Exception as e:
             self._logger.warning(f"Could not setup file logging: {e}")
 
+    def _add_file_handler(self, file_handler: logging.Handler):
+        """
+        In the main process, audit-log writes go through a queue drained by a background thread so
+        callers never block on disk I/O. Worker processes write directly: a forked child has no
+        listener thread, and pool workers exit without running atexit to drain a queue.
+        """
+        if multiprocessing.parent_process() is not None:
+            self._logger.addHandler(file_handler)
+            return
+        
+        queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        listener = logging.handlers.QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        self._logger.addHandler(queue_handler)
+        
+        def use_direct_file_handler():
+            self._logger.removeHandler(queue_handler)
+            self._logger.addHandler(file_handler)
+        
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=use_direct_file_handler)
+
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         if name:
-            return logging.getLogger(f'revelare.{name}')
+            # Cached so repeated lookups skip the logging manager's lock
+            logger = self._sublogger_cache.get(name)
+            if logger is None:
+                logger = self._sublogger_cache.setdefault(name, logging.getLogger(f'revelare.{name}'))
+            return logger
         return self._logger
 
     def log_security_event(self, event_type: str, details: str, severity: str = 'medium'):
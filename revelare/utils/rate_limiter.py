@@ -0,0 +1,37 @@
+import time
+import threading
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Waiters compute how long they need to wait while holding the lock, then
+    sleep outside it, so concurrent callers don't queue up behind one sleeper.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_interval(cls, interval: float, capacity: float = 1.0) -> 'TokenBucket':
+        """Build a bucket that allows one request every `interval` seconds on average"""
+        return cls(rate=1.0 / interval if interval > 0 else 0.0, capacity=capacity)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
@@ -1,6 +1,11 @@
+import io
 import json
+import os
 import re
-from typing import Dict, List, Any
+import functools
+from collections import Counter
+from html import escape
+from typing import Dict, List, Any, TextIO
 from datetime import datetime, timezone
 import logging
 
@@ -12,6 +17,11 @@ from revelare.utils.geoip_service import GeoIPService
 logger = get_logger(__name__)
 report_logger = RevelareLogger.get_logger('reporter')
 
+# Extractor contexts read "File: <name> | Position: <n>", so one search usually yields both fields
+_CONTEXT_RE = re.compile(r'File: ([^|]+)(?:\|\s*Position: (\d+))?')
+_POSITION_RE = re.compile(r'Position: (\d+)')
+
+@functools.lru_cache(maxsize=256)
 def _get_category_badge_class(category: str) -> str:
     category_lower = category.lower().replace('_', '-')
     if 'ip' in category_lower: return 'category-ip'
@@ -40,26 +50,27 @@ class ReportGenerator:
     def enrich_ips(self, ip_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
         try:
             with GeoIPService() as geoip:
-                return geoip.enrich_ips(list(set(ip_addresses)))
+                # enrich_ips dedups and sorts the addresses itself
+                return geoip.enrich_ips(ip_addresses)
         except Exception as e:
             report_logger.error(f"Failed to initialize or run GeoIP service: {e}")
             return {}
     
-    def _generate_timeline_view(self, normalized_data: List[Dict[str, Any]]) -> str:
+    def _generate_timeline_view(self, normalized_data: Dict[str, List[str]]) -> str:
         """
         Generates an HTML timeline view for extracted timestamps.
         """
         timestamps = []
-        for item in normalized_data:
-            if item['category'] == 'Timestamps' or item['category'] == 'ISO_Timestamps' or item['category'] == 'Unix_Timestamps':
+        for category, val, file_source, position in zip(normalized_data['category'], normalized_data['value'],
+                                                        normalized_data['file_source'], normalized_data['position']):
+            if category == 'Timestamps' or category == 'ISO_Timestamps' or category == 'Unix_Timestamps':
                 try:
                     # Parse timestamp (simplified)
-                    val = item['value']
                     # Try to normalize to sortable format
                     timestamps.append({
                         'raw': val,
-                        'file': item['file_source'],
-                        'details': item['position'] if item['position'] != 'N/A' else 'Extracted'
+                        'file': file_source,
+                        'details': position if position != 'N/A' else 'Extracted'
                     })
                 except:
                     pass
@@ -70,31 +81,51 @@ class ReportGenerator:
         if not timestamps:
             return ""
 
-        timeline_html = """
+        # Collect fragments and join once; repeated += re-copies the whole page for every row
+        timeline_parts = ["""
         <div id="timeline" class="section">
             <h2 class="section-title">Timeline Analysis</h2>
             <div class="timeline">
-        """
+        """]
         
         for ts in timestamps:
-            timeline_html += f"""
+            timeline_parts.append(f"""
                 <div class="timeline-item">
-                    <div class="timeline-date">{ts['raw']}</div>
+                    <div class="timeline-date">{escape(ts['raw'])}</div>
                     <div class="timeline-content">
-                        <strong>{ts['file']}</strong><br>
-                        <span class="text-muted">{ts['details']}</span>
+                        <strong>{escape(ts['file'])}</strong><br>
+                        <span class="text-muted">{escape(ts['details'])}</span>
                     </div>
                 </div>
-            """
+            """)
             
-        timeline_html += """
+        timeline_parts.append("""
             </div>
         </div>
-        """
-        return timeline_html
+        """)
+        return ''.join(timeline_parts)
 
     def generate_report(self, project_name: str, findings: Dict[str, Dict[str, Any]], 
                         enriched_ips: Dict[str, Dict[str, Any]] = None) -> str:
+        buffer = io.StringIO()
+        self.write_report(buffer, project_name, findings, enriched_ips)
+        return buffer.getvalue()
+
+    def write_report_file(self, report_path: str, project_name: str, findings: Dict[str, Dict[str, Any]],
+                          enriched_ips: Dict[str, Dict[str, Any]] = None) -> None:
+        """Stream the report to report_path, replacing any previous report only once it is complete"""
+        temp_path = report_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                self.write_report(f, project_name, findings, enriched_ips)
+            os.replace(temp_path, report_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def write_report(self, out_fp: TextIO, project_name: str, findings: Dict[str, Dict[str, Any]], 
+                     enriched_ips: Dict[str, Dict[str, Any]] = None) -> None:
         try:
             report_logger.info(f"Generating report components for project: {project_name}")
             
@@ -102,45 +133,50 @@ class ReportGenerator:
             
             category_options = self._generate_category_options(stats)
             file_options = self._generate_file_options(normalized_data)
-            indicators_table = self._generate_indicators_table(normalized_data, enriched_ips)
             timeline_view = self._generate_timeline_view(normalized_data)
             map_view = self._generate_map_view(normalized_data)
             
             generation_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
             template = self._get_html_template()
-            
-            report_html = template.format(
+            fields = dict(
                 project_name=project_name,
                 generation_date=generation_date,
                 stats_cards=self._generate_stats_cards(stats),
                 category_options=category_options,
                 file_options=file_options,
-                total_indicators=len(normalized_data),
-                indicators_table=indicators_table,
+                total_indicators=len(normalized_data['value']),
                 timeline_section=timeline_view,
                 map_section=map_view
             )
             
+            # The indicators table dwarfs everything else, so write it row by row between the
+            # formatted halves of the template instead of building the whole page in memory
+            template_head, template_tail = template.split('{indicators_table}')
+            out_fp.write(template_head.format(**fields))
+            out_fp.writelines(self._iter_indicators_table(normalized_data, enriched_ips))
+            out_fp.write(template_tail.format(**fields))
+            
             report_logger.info(f"Report HTML generated successfully for {project_name}")
-            return report_html
             
         except Exception as e:
             report_logger.error(f"Critical error generating report: {e}", exc_info=True)
             raise
 
-    def _generate_map_view(self, normalized_data: List[Dict[str, Any]]) -> str:
+    def _generate_map_view(self, normalized_data: Dict[str, List[str]]) -> str:
         """
         Generates a Leaflet map section if GPS coordinates are found.
         """
         markers = []
-        for item in normalized_data:
-            if item['category'] == 'GPS_Coordinates':
+        for category, value, file_source in zip(normalized_data['category'], normalized_data['value'],
+                                                normalized_data['file_source']):
+            if category == 'GPS_Coordinates':
                 try:
-                    lat, lon = map(str.strip, item['value'].split(','))
+                    lat, lon = map(str.strip, value.split(','))
                     markers.append({
                         'lat': float(lat), 
                         'lon': float(lon), 
-                        'popup': f"File: {item['file_source']}<br>Coords: {item['value']}"
+                        # Leaflet renders popups as HTML
+                        'popup': f"File: {escape(file_source)}<br>Coords: {escape(value)}"
                     })
                 except:
                     pass
@@ -152,7 +188,7 @@ class ReportGenerator:
         <div id="geographic" class="section">
             <h2 class="section-title">Geospatial Analysis</h2>
             <div class="map-container">
-                <div id="map" style="height: 500px; width: 100%;"></div>
+                <div id="map" style="height: 500px; width: 100%%;"></div>
             </div>
             <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" integrity="sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=" crossorigin=""/>
             <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js" integrity="sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=" crossorigin=""></script>
@@ -179,12 +215,17 @@ class ReportGenerator:
                 });
             </script>
         </div>
-        """ % json.dumps(markers)
+        """ % json.dumps(markers).replace('</', '<\\/')  # keep "</script>" in evidence from closing the block
         
         return map_html
 
     def _prepare_report_data(self, findings: Dict[str, Dict[str, Any]]):
-        normalized_data = []
+        # Column lists rather than a dict per indicator: one list slot per field instead of a full dict each
+        normalized_data = {'category': [], 'value': [], 'file_source': [], 'position': []}
+        categories = normalized_data['category']
+        values = normalized_data['value']
+        file_sources = normalized_data['file_source']
+        positions = normalized_data['position']
         stats = {'total': 0, 'files': set()}
         
         for category, items in findings.items():
@@ -192,29 +233,33 @@ class ReportGenerator:
                 stats['summary'] = items
                 continue
 
+            if items:
+                stats[category] = stats.get(category, 0) + len(items)
+                stats['total'] += len(items)
+
             for value, context_str in items.items():
-                stats[category] = stats.get(category, 0) + 1
-                stats['total'] += 1
 
                 file_source = "Unknown"
                 position = "N/A"
                 
                 if isinstance(context_str, str):
-                    file_match = re.search(r'File: ([^|]+)', context_str)
-                    if file_match:
-                        file_source = file_match.group(1).strip()
-                    pos_match = re.search(r'Position: (\d+)', context_str)
-                    if pos_match:
-                        position = pos_match.group(1).strip()
+                    context_match = _CONTEXT_RE.search(context_str)
+                    if context_match:
+                        file_source = context_match.group(1).strip()
+                        # Only trust the fused position if it is the first "Position:" in the context
+                        if context_match.group(2) and context_str.find('Position: ') == context_match.start(2) - 10:
+                            position = context_match.group(2)
+                    if position == "N/A" and 'Position: ' in context_str:
+                        pos_match = _POSITION_RE.search(context_str)
+                        if pos_match:
+                            position = pos_match.group(1)
                 
                 stats['files'].add(file_source)
 
-                normalized_data.append({
-                    'category': category,
-                    'value': value,
-                    'file_source': file_source,
-                    'position': position
-                })
+                categories.append(category)
+                values.append(value)
+                file_sources.append(file_source)
+                positions.append(position)
         
         return normalized_data, stats
     
@@ -242,21 +287,22 @@ class ReportGenerator:
             options.append(f'<option value="{category}">{category.replace("_", " ").title()} ({stats[category]})</option>')
         return ''.join(options)
     
-    def _generate_file_options(self, normalized_data: List[Dict[str, Any]]) -> str:
-        file_counts = {}
-        for item in normalized_data:
-             file_counts[item['file_source']] = file_counts.get(item['file_source'], 0) + 1
+    def _generate_file_options(self, normalized_data: Dict[str, List[str]]) -> str:
+        file_counts = Counter(normalized_data['file_source'])
              
         options = []
         for file in sorted(file_counts.keys()):
-            options.append(f'<option value="{file}">{file} ({file_counts[file]})</option>')
+            escaped_file = escape(file)
+            options.append(f'<option value="{escaped_file}">{escaped_file} ({file_counts[file]})</option>')
         return ''.join(options)
     
-    def _generate_indicators_table(self, normalized_data: List[Dict[str, Any]], enriched_ips: Dict[str, Dict[str, Any]] = None) -> str:
-        if not normalized_data:
-            return '<div class="no-data">No indicators found</div>'
+    def _iter_indicators_table(self, normalized_data: Dict[str, List[str]], enriched_ips: Dict[str, Dict[str, Any]] = None):
+        """Yield the indicators table HTML a row at a time"""
+        if not normalized_data['value']:
+            yield '<div class="no-data">No indicators found</div>'
+            return
         
-        table_html = """
+        yield """
         <table>
             <thead>
                 <tr>
@@ -270,25 +316,36 @@ class ReportGenerator:
             <tbody>
         """
         
-        for item in normalized_data:
-            details = ""
-            if ('IPv4' in item['category'] or 'IPv6' in item['category']) and enriched_ips and item['value'] in enriched_ips:
-                details = _format_enrichment_data(enriched_ips[item['value']])
+        # Badge class, label and IP flag depend only on the category, so work them out once per category
+        category_meta = {}
+        # Indicator values and file names come straight from evidence, so escape them; few distinct files, many rows
+        escaped_files = {file_source: escape(file_source) for file_source in set(normalized_data['file_source'])}
+        for category, value, file_source, position in zip(normalized_data['category'], normalized_data['value'],
+                                                          normalized_data['file_source'], normalized_data['position']):
+            meta = category_meta.get(category)
+            if meta is None:
+                meta = category_meta[category] = (
+                    _get_category_badge_class(category),
+                    category.replace('_', ' '),
+                    'IPv4' in category or 'IPv6' in category
+                )
+            category_class, category_label, is_ip = meta
 
-            category_class = _get_category_badge_class(item['category'])
+            details = ""
+            if is_ip and enriched_ips and value in enriched_ips:
+                details = escape(_format_enrichment_data(enriched_ips[value]))
             
-            table_html += f"""
+            yield f"""
                 <tr>
-                    <td><span class="category-badge {category_class}">{item['category'].replace('_', ' ')}</span></td>
-                    <td><span class="indicator-value">{item['value']}</span></td>
+                    <td><span class="category-badge {category_class}">{category_label}</span></td>
+                    <td><span class="indicator-value">{escape(value)}</span></td>
                     <td><span class="details-info">{details}</span></td>
-                    <td><span class="file-source">{item['file_source']}</span></td>
-                    <td>{item['position']}</td>
+                    <td><span class="file-source">{escaped_files[file_source]}</span></td>
+                    <td>{position}</td>
                 </tr>
                 """
         
-        table_html += "</tbody></table>"
-        return table_html
+        yield "</tbody></table>"
         
     def _get_html_template(self):
         return """
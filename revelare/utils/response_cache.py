@@ -0,0 +1,75 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Optional
+
+from revelare.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ResponseCache:
+    """SQLite-backed cache for external API responses that persists across runs.
+
+    Entries are grouped by namespace (one per API) and expire after ttl_seconds.
+    Any database error is logged and treated as a cache miss so lookups never
+    fail because of the cache.
+    """
+
+    def __init__(self, db_path: str, namespace: str, ttl_seconds: float):
+        self.db_path = db_path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+            # WAL lets concurrent processes (web UI, batch scripts) read while another writes
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS api_cache (
+                    namespace TEXT NOT NULL,
+                    cache_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, cache_key)
+                )
+            ''')
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT payload FROM api_cache WHERE namespace = ? AND cache_key = ? AND stored_at > ?',
+                    (self.namespace, key, time.time() - self.ttl_seconds)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.debug(f"Response cache read failed for {self.namespace}:{key}: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO api_cache (namespace, cache_key, payload, stored_at) VALUES (?, ?, ?, ?)',
+                    (self.namespace, key, payload, time.time())
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.debug(f"Response cache write failed for {self.namespace}:{key}: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -6,16 +6,84 @@ Implements actual API calls to external threat intelligence services
 import requests
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from revelare.config.config import Config
+from revelare.utils.rate_limiter import TokenBucket
+from revelare.utils.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # let requests raise its own (RequestException-derived) error
+    return response.json()
+
+def _build_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated lookups reuse TCP/TLS connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                          max_retries=Retry(total=2, backoff_factor=0.3,
+                                            status_forcelist=[502, 503, 504]))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'})
+    return session
+
+_SESSION = _build_session()
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling a service whose circuit breaker is open"""
+
+class CircuitBreaker:
+    """Stops calling a failing service for a cooldown period after repeated failures"""
+    
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        with self._lock:
+            if self.consecutive_failures < self.failure_threshold:
+                return False
+            if not self._probe_in_flight and time.monotonic() - self.opened_at >= self.cooldown_seconds:
+                # Half-open: let a single request through to probe the service
+                self._probe_in_flight = True
+                return False
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
 class ThreatIntelligenceService:
     """Service for querying external threat intelligence APIs"""
     
     def __init__(self):
-        self.last_request_times = {}
         self.rate_limits = {
             'abuseipdb': Config.ABUSEIPDB_RATE_LIMIT,
             'virustotal': Config.VIRUSTOTAL_RATE_LIMIT,
@@ -24,6 +92,10 @@ class ThreatIntelligenceService:
             'bitcoin_abuse': Config.BITCOIN_ABUSE_RATE_LIMIT,
             'chainabuse': Config.CHAINABUSE_RATE_LIMIT
         }
+        self.rate_limiters = {
+            service: TokenBucket.from_interval(interval)
+            for service, interval in self.rate_limits.items()
+        }
         self.timeouts = {
             'abuseipdb': Config.ABUSEIPDB_TIMEOUT,
             'virustotal': Config.VIRUSTOTAL_TIMEOUT,
@@ -32,22 +104,41 @@ class ThreatIntelligenceService:
             'bitcoin_abuse': Config.BITCOIN_ABUSE_TIMEOUT,
             'chainabuse': Config.CHAINABUSE_TIMEOUT
         }
+        self.circuit_breakers = {
+            service: CircuitBreaker(Config.THREAT_INTEL_FAILURE_THRESHOLD, Config.THREAT_INTEL_CIRCUIT_COOLDOWN)
+            for service in self.rate_limits
+        }
+        self.cache = ResponseCache(Config.API_CACHE_DATABASE, 'threat_intel', Config.THREAT_INTEL_CACHE_TTL)
     
     def _rate_limit(self, service: str):
         """Apply rate limiting for the specified service"""
-        if service in self.last_request_times:
-            elapsed = time.time() - self.last_request_times[service]
-            if elapsed < self.rate_limits[service]:
-                time.sleep(self.rate_limits[service] - elapsed)
-        self.last_request_times[service] = time.time()
+        self.rate_limiters[service].acquire()
+    
+    def _request(self, service: str, method: str, url: str, **kwargs) -> requests.Response:
+        """Rate-limited request through the shared session, guarded by the service's circuit breaker"""
+        breaker = self.circuit_breakers[service]
+        if breaker.is_open():
+            raise CircuitOpenError(f"{service} circuit open after repeated failures; skipping request")
+        
+        try:
+            self._rate_limit(service)
+            response = _SESSION.request(method, url, timeout=self.timeouts[service], **kwargs)
+        except Exception:
+            # Any failure must settle the breaker, or a half-open probe would never be released
+            breaker.record_failure()
+            raise
+        
+        if response.status_code == 429 or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
     
     def check_ip_reputation(self, ip: str) -> Dict[str, Any]:
         """Check IP reputation using AbuseIPDB"""
         if not Config.ABUSEIPDB_API_KEY:
             return {'error': 'AbuseIPDB API key not configured'}
         
-        self._rate_limit('abuseipdb')
-        
         try:
             url = 'https://api.abuseipdb.com/api/v2/check'
             headers = {
@@ -60,11 +151,10 @@ class ThreatIntelligenceService:
                 'verbose': ''
             }
             
-            response = requests.get(url, headers=headers, params=params, 
-                                  timeout=self.timeouts['abuseipdb'])
+            response = self._request('abuseipdb', 'GET', url, headers=headers, params=params)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get('data'):
                     ip_data = data['data']
                     return {
@@ -94,8 +184,6 @@ class ThreatIntelligenceService:
         if not Config.VIRUSTOTAL_API_KEY:
             return {'error': 'VirusTotal API key not configured'}
         
-        self._rate_limit('virustotal')
-        
         try:
             # First, get URL report
             url_report_url = 'https://www.virustotal.com/vtapi/v2/url/report'
@@ -104,11 +192,10 @@ class ThreatIntelligenceService:
                 'resource': url
             }
             
-            response = requests.get(url_report_url, params=params, 
-                                  timeout=self.timeouts['virustotal'])
+            response = self._request('virustotal', 'GET', url_report_url, params=params)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get('response_code') == 1:  # URL found
                     scans = data.get('scans', {})
                     positives = data.get('positives', 0)
@@ -140,17 +227,14 @@ class ThreatIntelligenceService:
         if not Config.SHODAN_API_KEY:
             return {'error': 'Shodan API key not configured'}
         
-        self._rate_limit('shodan')
-        
         try:
             url = f'https://api.shodan.io/shodan/host/{ip}'
             params = {'key': Config.SHODAN_API_KEY}
             
-            response = requests.get(url, params=params, 
-                                  timeout=self.timeouts['shodan'])
+            response = self._request('shodan', 'GET', url, params=params)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 return {
                     'country': data.get('country_name', ''),
                     'city': data.get('city', ''),
@@ -177,8 +261,6 @@ class ThreatIntelligenceService:
         if not Config.URLSCAN_API_KEY:
             return {'error': 'URLScan API key not configured'}
         
-        self._rate_limit('urlscan')
-        
         try:
             # Submit URL for scanning
             submit_url = 'https://urlscan.io/api/v1/scan/'
@@ -191,11 +273,10 @@ class ThreatIntelligenceService:
                 'visibility': 'public'
             }
             
-            response = requests.post(submit_url, headers=headers, json=data,
-                                   timeout=self.timeouts['urlscan'])
+            response = self._request('urlscan', 'POST', submit_url, headers=headers, json=data)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _parse_json(response)
                 scan_id = result.get('uuid')
                 
                 if scan_id:
@@ -221,8 +302,6 @@ class ThreatIntelligenceService:
         if not Config.BITCOIN_ABUSE_API_KEY:
             return {'error': 'Bitcoin Abuse API key not configured'}
         
-        self._rate_limit('bitcoin_abuse')
-        
         try:
             url = 'https://www.bitcoinabuse.com/api/reports/check'
             params = {
@@ -230,11 +309,10 @@ class ThreatIntelligenceService:
                 'address': address
             }
             
-            response = requests.get(url, params=params, 
-                                  timeout=self.timeouts['bitcoin_abuse'])
+            response = self._request('bitcoin_abuse', 'GET', url, params=params)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 return {
                     'abuse_count': data.get('count', 0),
                     'first_seen': data.get('first_seen', ''),
@@ -256,8 +334,6 @@ class ThreatIntelligenceService:
         if not Config.CHAINABUSE_API_KEY:
             return {'error': 'Chainabuse API key not configured'}
         
-        self._rate_limit('chainabuse')
-        
         try:
             url = 'https://api.chainabuse.com/v1/addresses'
             headers = {
@@ -266,11 +342,10 @@ class ThreatIntelligenceService:
             }
             params = {'address': address}
             
-            response = requests.get(url, headers=headers, params=params,
-                                  timeout=self.timeouts['chainabuse'])
+            response = self._request('chainabuse', 'GET', url, headers=headers, params=params)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 if data.get('data'):
                     address_data = data['data'][0] if data['data'] else {}
                     return {
@@ -295,44 +370,78 @@ class ThreatIntelligenceService:
     
     def enrich_indicator(self, indicator: str, indicator_type: str) -> Dict[str, Any]:
         """Enrich a single indicator with all available threat intelligence"""
+        cache_key = f"{indicator_type}:{indicator}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         results = {
             'indicator': indicator,
             'type': indicator_type,
             'enrichments': {}
         }
+        complete = True
         
         if indicator_type == 'ip':
             # IP reputation check
             abuse_result = self.check_ip_reputation(indicator)
             if 'error' not in abuse_result:
                 results['enrichments']['abuseipdb'] = abuse_result
+            else:
+                complete = False
             
             # Device information
             shodan_result = self.check_ip_device_info(indicator)
             if 'error' not in shodan_result:
                 results['enrichments']['shodan'] = shodan_result
+            else:
+                complete = False
                 
         elif indicator_type == 'url':
             # URL reputation check
             vt_result = self.check_url_reputation(indicator)
             if 'error' not in vt_result:
                 results['enrichments']['virustotal'] = vt_result
+            else:
+                complete = False
             
             # URL analysis
             urlscan_result = self.scan_url(indicator)
             if 'error' not in urlscan_result:
                 results['enrichments']['urlscan'] = urlscan_result
+            else:
+                complete = False
                 
         elif indicator_type == 'bitcoin_address':
             # Bitcoin address check
             bitcoin_result = self.check_bitcoin_address(indicator)
             if 'error' not in bitcoin_result:
                 results['enrichments']['bitcoin_abuse'] = bitcoin_result
+            else:
+                complete = False
                 
         elif indicator_type == 'crypto_address':
             # General crypto address check
             crypto_result = self.check_crypto_address(indicator)
             if 'error' not in crypto_result:
                 results['enrichments']['chainabuse'] = crypto_result
+            else:
+                complete = False
+        
+        # Only cache complete answers so a timed-out service or newly configured API key is retried next run
+        if results['enrichments'] and complete:
+            self.cache.set(cache_key, results)
         
         return results
+    
+    def enrich_indicators(self, indicators: List[str], indicator_type: str) -> Dict[str, Dict[str, Any]]:
+        """Enrich many indicators concurrently, querying each unique value only once"""
+        unique_indicators = list(dict.fromkeys(indicators))
+        if not unique_indicators:
+            return {}
+        
+        max_workers = max(1, min(Config.THREAT_INTEL_MAX_WORKERS, len(unique_indicators)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(lambda indicator: self.enrich_indicator(indicator, indicator_type),
+                                   unique_indicators)
+            return dict(zip(unique_indicators, results))